@@ -4,41 +4,256 @@ Comprehensive Visualization Script
 Creates graphs comparing gRPC vs REST results across services and test scenarios
 """
 
-import json
+from __future__ import annotations
+
 import os
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
-import numpy as np
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set style for better-looking plots
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+from json_loading import load_json_file
+
+
+def _import_plotting():
+    """
+    Import and configure pandas, numpy and matplotlib on first use
+    
+    They dominate startup time, so main() only pays for them once the metrics
+    directory is known to exist. Render workers call this too, in case they were
+    started without the parent's modules.
+    """
+    global plt, PolyCollection, offset_copy, pd, np
+    if 'plt' in globals():
+        return
+    
+    import matplotlib
+    matplotlib.use('Agg')  # Batch PNG generation, no GUI backend needed
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import PolyCollection
+    from matplotlib import font_manager
+    from matplotlib.transforms import offset_copy
+    import pandas as pd
+    import numpy as np
+    
+    # Set style for better-looking plots
+    plt.rcParams.update({
+        'axes.grid': True,
+        'grid.alpha': 0.3,
+        'axes.prop_cycle': plt.cycler(color=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4']),
+        'text.hinting': 'none'
+    })
+    
+    # Resolve the default font once, before any worker process is forked
+    font_manager.findfont('DejaVu Sans')
+
+
+# Fast zlib level for PNG output: slightly larger files for much less encoding CPU
+_PNG_OPTIONS = {'compress_level': 1}
+
+# Line styling shared by both series of every trend chart
+_TREND_LINE_STYLE = {'linewidth': 3, 'markersize': 8, 'alpha': 0.8}
+
+# Marker and value label offset (points) for the first and second trend series
+_TREND_SERIES_STYLES = (('o-', 10), ('s-', -15))
+
+
+# Figures reused across charts within one process, keyed by figure size
+_FIGURES: Dict[Tuple[float, float], Tuple[Any, Any]] = {}
+
+
+def _reusable_axes(figsize: Tuple[float, float]):
+    """Return this process's figure and a cleared axes of the given size"""
+    if figsize not in _FIGURES:
+        # Fixed margins fit every chart's rotated tick labels without running a layout solver per save
+        fig, ax = plt.subplots(figsize=figsize)
+        fig.subplots_adjust(left=0.1, right=0.97, top=0.92, bottom=0.18)
+        _FIGURES[figsize] = (fig, ax)
+    
+    fig, ax = _FIGURES[figsize]
+    ax.clear()
+    return fig, ax
+
+
+# X positions reused across charts within one process, keyed by scenario count
+_X_POSITIONS: Dict[int, np.ndarray] = {}
+
+
+def _x_positions(count: int) -> np.ndarray:
+    """Return this process's cached x positions for the given number of scenarios"""
+    if count not in _X_POSITIONS:
+        _X_POSITIONS[count] = np.arange(count)
+    return _X_POSITIONS[count]
+
+
+
+def _render_grouped_bar(spec: Dict[str, Any]) -> str:
+    """
+    Render one grouped bar chart and save it as PNG
+    
+    Runs in a worker process, so the spec only carries labels, arrays and paths.
+    
+    Args:
+        spec: Chart specification queued by the MetricsVisualizer bar chart builders
+        
+    Returns:
+        Display name of the chart that was written
+    """
+    fig, ax = _reusable_axes(spec['figsize'])
+    
+    x = _x_positions(len(spec['scenarios']))
+    width = spec['width']
+    center = (len(spec['series']) - 1) / 2
+    label_offset = offset_copy(ax.transData, fig=fig, y=2, units='points')
+    
+    for i, (values, label, color) in enumerate(spec['series']):
+        # All bars of a series as one collection of (left, right) x (0, value) rectangles
+        values = np.asarray(values, dtype=float)
+        left = x + (i - center) * width - width / 2
+        right = left + width
+        verts = np.empty((len(values), 4, 2))
+        verts[:, :, 0] = np.stack([left, left, right, right], axis=1)
+        verts[:, :, 1] = 0.0
+        verts[:, 1:3, 1] = values[:, None]
+        
+        bars = PolyCollection(verts, facecolors=color, edgecolors='none', alpha=0.8, label=label,
+                              rasterized=True)
+        bars.sticky_edges.y.append(0)  # Keep the value axis anchored at zero, as ax.bar does
+        ax.add_collection(bars)
+        
+        # Add value labels on bars
+        for bar_x, height, text in zip(left + width / 2, values, np.char.mod(spec['value_format'], values)):
+            ax.text(bar_x, height, text, transform=label_offset, ha='center', va='bottom',
+                    fontsize=spec['label_fontsize'])
+    
+    ax.autoscale_view()
+    ax.set_xlabel('Test Scenario', fontsize=12)
+    ax.set_ylabel(spec['ylabel'], fontsize=12)
+    ax.set_title(spec['title'], fontsize=14, fontweight='bold')
+    ax.set_xticks(x)
+    ax.set_xticklabels(spec['scenarios'], rotation=45, ha='right')
+    ax.legend(fontsize=11)
+    ax.grid(True, alpha=0.3)
+    
+    fig.savefig(spec['path'], dpi=spec['dpi'], pil_kwargs=_PNG_OPTIONS)
+    
+    return spec['name']
+
+
+def _render_trend(spec: Dict[str, Any]) -> str:
+    """
+    Render one gRPC vs REST line graph and save it as PNG
+    
+    Runs in a worker process, so the spec only carries labels, arrays and paths.
+    
+    Args:
+        spec: Chart specification queued by MetricsVisualizer._plot_trend
+        
+    Returns:
+        Display name of the chart that was written
+    """
+    fig, ax = _reusable_axes(spec['figsize'])
+    x = _x_positions(len(spec['scenarios']))
+    
+    # Plot lines with markers; value labels sit above the first line and below the second
+    for (values, label, color), (style, offset) in zip(spec['series'], _TREND_SERIES_STYLES):
+        ax.plot(x, values, style, label=label, color=color, **_TREND_LINE_STYLE)
+        
+        label_offset = offset_copy(ax.transData, fig=fig, y=offset, units='points')
+        for i, value, text in zip(x, values, np.char.mod(spec['value_format'], values)):
+            ax.text(i, value, text, transform=label_offset, ha='center', fontsize=9, color=color)
+    
+    ax.set_xlabel('Test Scenario', fontsize=12)
+    ax.set_ylabel(spec['ylabel'], fontsize=12)
+    ax.set_title(spec['title'], fontsize=14, fontweight='bold')
+    ax.set_xticks(x)
+    ax.set_xticklabels(spec['scenarios'], rotation=45, ha='right')
+    ax.legend(fontsize=11)
+    ax.grid(True, alpha=0.3)
+    
+    fig.savefig(spec['path'], dpi=spec['dpi'], pil_kwargs=_PNG_OPTIONS)
+    
+    return spec['name']
+
+
+# Worker render function for each queued chart kind
+_RENDERERS = {
+    'bar': _render_grouped_bar,
+    'line': _render_trend
+}
+
+
+def _render_chart(spec: Dict[str, Any]) -> str:
+    """Render a queued chart spec with the renderer for its kind"""
+    _import_plotting()
+    return _RENDERERS[spec['kind']](spec)
+
+
+def _png_dpi(path: str) -> Optional[int]:
+    """Read the resolution a chart was saved at from its PNG header, or None if it is not recorded"""
+    from PIL import Image
+    
+    try:
+        with Image.open(path) as image:
+            dpi = image.info.get('dpi')
+    except OSError:
+        return None
+    # PNG stores pixels per meter, so e.g. 120 dpi reads back as 119.9968
+    return round(dpi[0]) if dpi else None
+
 
 class MetricsVisualizer:
-    def __init__(self, metrics_dir: str, output_dir: str):
+    # Protocol colors shared by every comparison chart
+    _GRPC_COLOR = '#FF6B6B'
+    _REST_COLOR = '#4ECDC4'
+    
+    def __init__(self, metrics_dir: str, output_dir: str, incremental: bool = False, dpi: int = 120):
         """
         Initialize the visualizer
         
         Args:
             metrics_dir: Directory containing extracted metrics
             output_dir: Directory to save generated charts
+            incremental: Skip comparison charts whose PNG is newer than every metrics file they use
+                and was saved at the same dpi
+            dpi: Resolution of every saved chart, including the summary dashboard
         """
+        _import_plotting()
+        
         self.metrics_dir = metrics_dir
         self.output_dir = output_dir
+        self.incremental = incremental
         self.protocols = ['grpc', 'rest']
         self.services = ['order', 'product', 'user', 'payment']
         self.test_scenarios = ['average_load', 'high_load', 'breakpoint', 'spike']
         
+        # Display titles are reused across every chart
+        self._scenario_titles = {s: s.replace('_', ' ').title() for s in self.test_scenarios}
+        
+        # Screen resolution for all charts; raster size (and PNG encoding time) grows with dpi squared
+        self.dpi = dpi
+        
         # Create output directory structure
         self.create_output_structure()
         
+        # Chart output paths, built once per (folder..., filename) key
+        self._png_paths = {}
+        
         # Load all metrics data
         self.metrics_data = self.load_all_metrics()
+        
+        # Flat tuple-keyed lookups, plus a tidy (one row per value) view used to slice chart data
+        self._index_metrics()
+        self._df = self._flatten_to_frame()
+        self._pivot_cache = {}
+        
+        # (category, service) pairs with any data, so builders can skip whole families up front
+        self._available = {('logs', key[2]) for key in self._logs} | {('infrastructure', key[2]) for key in self._infra}
+        if self._k6:
+            self._available.add(('k6', None))
     
     def create_output_structure(self):
         """Create organized folder structure for charts"""
@@ -53,23 +268,16 @@ class MetricsVisualizer:
             'line_graphs'
         ]
         
-        # Create main output directory
-        os.makedirs(self.output_dir, exist_ok=True)
-        
-        # Create category subdirectories
-        for category in categories:
-            category_path = os.path.join(self.output_dir, category)
-            os.makedirs(category_path, exist_ok=True)
-        
-        # Create service-specific subdirectories within per_service folders
+        # Category folders plus service-specific subdirectories within per_service folders;
+        # mkdir(parents=True) creates the main output directory along the way
+        output = Path(self.output_dir)
+        directories = [output / category for category in categories]
         for service in self.services:
-            # Infrastructure subdirectories
-            infra_service_path = os.path.join(self.output_dir, 'per_service_infrastructure', service)
-            os.makedirs(infra_service_path, exist_ok=True)
-            
-            # Logs subdirectories
-            logs_service_path = os.path.join(self.output_dir, 'per_service_logs', service)
-            os.makedirs(logs_service_path, exist_ok=True)
+            directories.append(output / 'per_service_infrastructure' / service)
+            directories.append(output / 'per_service_logs' / service)
+        
+        for directory in directories:
+            directory.mkdir(parents=True, exist_ok=True)
         
         print(f"📁 Created organized output structure in: {self.output_dir}")
         
@@ -77,6 +285,8 @@ class MetricsVisualizer:
         """Load all metrics from the extracted_metrics directory"""
         metrics = {}
         
+        # Walk the directory tree once to collect every metrics file
+        files = []
         for protocol in self.protocols:
             metrics[protocol] = {}
             for scenario in self.test_scenarios:
@@ -84,48 +294,224 @@ class MetricsVisualizer:
                 test_path = os.path.join(self.metrics_dir, test_dir)
                 
                 if os.path.exists(test_path):
-                    metrics[protocol][scenario] = self.load_test_metrics(test_path)
+                    metrics[protocol][scenario] = {'infrastructure': {}}
+                    for service, kind, path in self.find_test_metric_files(test_path):
+                        files.append((protocol, scenario, service, kind, path))
+        
+        # Newest modification time of the files feeding each (kind, service) bucket
+        self._source_mtimes = {}
+        
+        # Files are independent, so read and parse them concurrently
+        with ThreadPoolExecutor(max_workers=16, thread_name_prefix='metrics-load') as executor:
+            loaded = executor.map(self._load_json, [path for *_, path in files])
+            
+            # Results come back in submission order, so test-level logs are
+            # bucketed before the per-service logs that refine them
+            for (protocol, scenario, service, kind, path), data in zip(files, loaded):
+                if data is None:
+                    continue
+                
+                key = (kind, service)
+                self._source_mtimes[key] = max(self._source_mtimes.get(key, 0.0), os.path.getmtime(path))
+                
+                test_metrics = metrics[protocol][scenario]
+                if service is None:
+                    test_metrics[kind] = data
+                else:
+                    test_metrics.setdefault(kind, {})[service] = data
         
         return metrics
     
-    def load_test_metrics(self, test_path: str) -> Dict[str, Any]:
-        """Load metrics for a specific test scenario"""
-        test_metrics = {}
-        
-        # Load k6 metrics
-        k6_file = os.path.join(test_path, "k6_metrics.json")
-        if os.path.exists(k6_file):
-            with open(k6_file, 'r') as f:
-                test_metrics['k6'] = json.load(f)
-        
-        # Load CloudWatch logs metrics
-        logs_file = os.path.join(test_path, "cloudwatch_logs_metrics.json")
-        if os.path.exists(logs_file):
-            with open(logs_file, 'r') as f:
-                test_metrics['logs'] = json.load(f)
-        
-        # Load CloudWatch infrastructure metrics per service
-        test_metrics['infrastructure'] = {}
+    @staticmethod
+    def _load_json(path: str) -> Any:
+        """Parse a JSON file (with orjson when installed), returning None if it has disappeared"""
+        try:
+            return load_json_file(path)
+        except FileNotFoundError:
+            return None
+    
+    def find_test_metric_files(self, test_path: str) -> List[Tuple[Optional[str], str, str]]:
+        """List the metrics files of a test scenario as (service, kind, path) tuples"""
+        files = []
+        
+        # List the test directory once instead of probing each file with os.path.exists
+        with os.scandir(test_path) as entries:
+            root_files = set()
+            service_dirs = set()
+            for entry in entries:
+                if entry.is_dir():
+                    service_dirs.add(entry.name)
+                else:
+                    root_files.add(entry.name)
+        
+        # K6 metrics
+        if "k6_metrics.json" in root_files:
+            files.append((None, 'k6', os.path.join(test_path, "k6_metrics.json")))
+        
+        # CloudWatch logs metrics
+        if "cloudwatch_logs_metrics.json" in root_files:
+            files.append((None, 'logs', os.path.join(test_path, "cloudwatch_logs_metrics.json")))
+        
+        # CloudWatch infrastructure and logs metrics per service
         for service in self.services:
+            if service not in service_dirs:
+                continue
+            
             service_dir = os.path.join(test_path, service)
-            if os.path.exists(service_dir):
-                infra_file = os.path.join(service_dir, "cloudwatch_metrics.json")
-                logs_file = os.path.join(service_dir, "cloudwatch_logs_metrics.json")
+            with os.scandir(service_dir) as entries:
+                service_files = {entry.name for entry in entries if entry.is_file()}
+            
+            if "cloudwatch_metrics.json" in service_files:
+                files.append((service, 'infrastructure', os.path.join(service_dir, "cloudwatch_metrics.json")))
+            
+            if "cloudwatch_logs_metrics.json" in service_files:
+                files.append((service, 'logs', os.path.join(service_dir, "cloudwatch_logs_metrics.json")))
+        
+        return files
+    
+    def _index_metrics(self):
+        """
+        Index the nested metrics data into flat tuple-keyed dicts of numeric values
+        
+        Sets:
+            self._k6: (protocol, scenario, metric) -> value
+            self._logs: (protocol, scenario, service, operation, metric) -> value
+            self._infra: (protocol, scenario, service, metric) -> average_maximum
+        """
+        self._k6 = {}
+        self._logs = {}
+        self._infra = {}
+        
+        for protocol, scenarios in self.metrics_data.items():
+            for scenario, scenario_data in scenarios.items():
+                # K6 metrics: k6 -> metric -> value
+                for metric, value in scenario_data.get('k6', {}).items():
+                    if isinstance(value, (int, float)):
+                        self._k6[(protocol, scenario, metric)] = value
                 
-                if os.path.exists(infra_file):
-                    with open(infra_file, 'r') as f:
-                        test_metrics['infrastructure'][service] = json.load(f)
+                # Logs metrics: logs -> service -> operation -> metric -> value
+                for service, operations in scenario_data.get('logs', {}).items():
+                    for operation, stats in operations.items():
+                        if not isinstance(stats, dict):
+                            continue
+                        for metric, value in stats.items():
+                            if isinstance(value, (int, float)):
+                                self._logs[(protocol, scenario, service, operation, metric)] = value
                 
-                if os.path.exists(logs_file):
-                    with open(logs_file, 'r') as f:
-                        test_metrics['logs'][service] = json.load(f)
+                # Infrastructure metrics: infrastructure -> service -> metric -> average_maximum
+                for service, service_metrics in scenario_data.get('infrastructure', {}).items():
+                    for metric, stats in service_metrics.items():
+                        if isinstance(stats, dict) and 'average_maximum' in stats:
+                            self._infra[(protocol, scenario, service, metric)] = stats['average_maximum']
+    
+    def _flatten_to_frame(self) -> pd.DataFrame:
+        """Build a tidy frame with one row per indexed numeric value"""
+        records = [(protocol, scenario, 'k6', None, None, metric, value)
+                   for (protocol, scenario, metric), value in self._k6.items()]
+        records += [(protocol, scenario, 'logs', service, operation, metric, value)
+                    for (protocol, scenario, service, operation, metric), value in self._logs.items()]
+        records += [(protocol, scenario, 'infrastructure', service, None, metric, value)
+                    for (protocol, scenario, service, metric), value in self._infra.items()]
+        
+        return pd.DataFrame.from_records(
+            records,
+            columns=['protocol', 'scenario', 'category', 'service', 'operation', 'metric', 'value'])
+    
+    def _paired_values(self, category: str, metric: str, service: Optional[str] = None,
+                       operation: Optional[str] = None,
+                       positive_only: bool = True) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """
+        Slice the gRPC and REST values of one metric across the test scenarios
+        
+        Args:
+            category: Metrics category ('k6', 'logs' or 'infrastructure')
+            metric: Metric name within the category
+            service: Service to select, if the category is per-service
+            operation: Operation to select, for logs metrics
+            positive_only: Drop scenarios where either protocol is not positive
+            
+        Returns:
+            Scenario titles plus the matching gRPC and REST value arrays
+        """
+        # Bar and line charts ask for the same slices, so each one is pivoted only once
+        key = (category, metric, service, operation)
+        if key not in self._pivot_cache:
+            df = self._df
+            mask = (df['category'] == category) & (df['metric'] == metric)
+            if service is not None:
+                mask &= df['service'] == service
+            if operation is not None:
+                mask &= df['operation'] == operation
+            
+            # Scenarios as rows (in test order), protocols as columns; keep scenarios both protocols report
+            self._pivot_cache[key] = (df.loc[mask]
+                                      .pivot(index='scenario', columns='protocol', values='value')
+                                      .reindex(index=self.test_scenarios, columns=['grpc', 'rest'])
+                                      .dropna())
+        
+        sub = self._pivot_cache[key]
+        if positive_only:
+            sub = sub[(sub > 0).all(axis=1)]
+        
+        scenarios = [self._scenario_titles[scenario] for scenario in sub.index]
+        return scenarios, sub['grpc'].to_numpy(), sub['rest'].to_numpy()
+    
+    def _has_data(self, category: str, service: Optional[str] = None) -> bool:
+        """Check whether any test reported metrics for a category (and service)"""
+        return (category, service) in self._available
+    
+    def _png_path(self, *parts: str) -> str:
+        """Return the PNG path for a chart, given its output folders and filename stem"""
+        if parts not in self._png_paths:
+            self._png_paths[parts] = os.path.join(self.output_dir, *parts[:-1], f'{parts[-1]}.png')
+        return self._png_paths[parts]
+    
+    def _is_current(self, path: str, category: str, service: Optional[str] = None) -> bool:
+        """
+        Check whether an incremental run can keep an existing chart
+        
+        Args:
+            path: Output PNG path of the chart
+            category: Metrics category the chart is drawn from ('k6', 'logs' or 'infrastructure')
+            service: Service the chart is drawn from, if the category is per-service
+            
+        Returns:
+            True if incremental mode is on and the PNG is newer than every source file
+            and was saved at the current dpi
+        """
+        if not self.incremental:
+            return False
+        
+        try:
+            chart_mtime = os.path.getmtime(path)
+        except FileNotFoundError:
+            return False
+        
+        # Test-level files feed every service of their category
+        newest_source = max(self._source_mtimes.get((category, None), 0.0),
+                            self._source_mtimes.get((category, service), 0.0))
+        if chart_mtime <= newest_source:
+            return False
         
-        return test_metrics
+        # Charts saved at another resolution (e.g. a different --dpi) are redrawn
+        if _png_dpi(path) != self.dpi:
+            return False
+        
+        self._skipped_charts += 1
+        return True
     
     def create_protocol_comparison_charts(self):
         """Create charts comparing gRPC vs REST across all metrics"""
         print("📊 Creating protocol comparison charts...")
         
+        # Progress messages are buffered; each queued chart holds its place among them
+        # until it is rendered
+        self._log = []
+        
+        # Chart builders only queue chart specs; they are rendered together below
+        self._chart_specs = []
+        self._skipped_charts = 0
+        
         # 1. K6 Performance Metrics Comparison
         self.create_k6_comparison_charts()
         
@@ -147,11 +533,95 @@ class MetricsVisualizer:
         # 7. Line Graph Comparisons
         self.create_line_graph_comparisons()
         
+        if self._skipped_charts:
+            self._log.append(f"  ⏭️  Skipped {self._skipped_charts} up-to-date charts")
+        
+        if self._chart_specs:
+            print(f"  🎨 Rendering {len(self._chart_specs)} charts...")
+        
+        # Charts are independent and CPU-bound, so they render in parallel; results come back
+        # in queue order, so each "Created" line is printed under its section header
+        created = self.render_charts(self._chart_specs)
+        lines = []
+        indent = ''
+        for entry in self._log:
+            if isinstance(entry, str):
+                lines.append(entry)
+                indent = ' ' * (len(entry) - len(entry.lstrip(' ')) + 2)
+                continue
+            
+            # A queued chart: flush the section so far, then wait for the chart itself
+            sys.stdout.write(''.join(line + '\n' for line in lines))
+            lines = [f"{indent}✅ Created: {next(created)}"]
+        
+        sys.stdout.write(''.join(line + '\n' for line in lines))
         print("✅ Protocol comparison charts created successfully!")
     
+    def _queue_chart(self, spec: Dict[str, Any]):
+        """Queue a chart spec for rendering, reserving its place in the progress log"""
+        self._chart_specs.append(spec)
+        self._log.append(spec)
+    
+    def render_charts(self, specs: List[Dict[str, Any]]) -> Iterator[str]:
+        """
+        Render queued chart specs in worker processes
+        
+        Args:
+            specs: Chart specs queued by the chart builders
+            
+        Returns:
+            Iterator over the created chart names, in spec order
+        """
+        # A single chart is not worth starting a pool for
+        if len(specs) <= 1:
+            yield from map(_render_chart, specs)
+            return
+        
+        with Pool(min(os.cpu_count() or 1, len(specs))) as pool:
+            yield from pool.imap(_render_chart, specs)
+    
+    def _queue_paired_bars(self, folders: Tuple[str, ...], filename: str, source: Tuple[str, Optional[str]],
+                           scenarios: List[str], grpc_values: np.ndarray, rest_values: np.ndarray,
+                           ylabel: str, title: str, value_format: str = '%.2f'):
+        """
+        Queue a gRPC vs REST grouped bar chart for rendering
+        
+        Args:
+            folders: Output folders of the chart, relative to the output directory
+            filename: Chart filename without the .png extension
+            source: (category, service) the chart values come from, for incremental runs
+            scenarios: Scenario titles along the x axis
+            grpc_values: gRPC value per scenario
+            rest_values: REST value per scenario
+            ylabel: Y axis label
+            title: Chart title
+            value_format: printf-style format of the bar value labels
+        """
+        path = self._png_path(*folders, filename)
+        if self._is_current(path, *source):
+            return
+        
+        self._queue_chart({
+            'kind': 'bar',
+            'name': '/'.join(folders + (f'{filename}.png',)),
+            'path': path,
+            'figsize': (12, 8),
+            'width': 0.35,
+            'scenarios': scenarios,
+            'series': [(grpc_values, 'gRPC', self._GRPC_COLOR), (rest_values, 'REST', self._REST_COLOR)],
+            'ylabel': ylabel,
+            'title': title,
+            'value_format': value_format,
+            'label_fontsize': 10,
+            'dpi': self.dpi
+        })
+    
     def create_k6_comparison_charts(self):
         """Create separate K6 metrics comparison charts"""
-        print("  📊 Creating K6 performance metrics charts...")
+        self._log.append("  📊 Creating K6 performance metrics charts...")
+        
+        if not self._has_data('k6'):
+            return
         
         metrics_to_plot = [
             ('throughput_requests_per_second', 'Throughput (req/s)', 'k6_throughput_comparison'),
@@ -164,58 +634,20 @@ class MetricsVisualizer:
         
         for metric, title, filename in metrics_to_plot:
             # Prepare data
-            grpc_values = []
-            rest_values = []
-            scenarios = []
-            
-            for scenario in self.test_scenarios:
-                if (scenario in self.metrics_data.get('grpc', {}) and 
-                    'k6' in self.metrics_data['grpc'][scenario] and
-                    metric in self.metrics_data['grpc'][scenario]['k6']):
-                    
-                    grpc_values.append(self.metrics_data['grpc'][scenario]['k6'][metric])
-                    rest_values.append(self.metrics_data['rest'][scenario]['k6'][metric])
-                    scenarios.append(scenario.replace('_', ' ').title())
+            scenarios, grpc_values, rest_values = self._paired_values('k6', metric, positive_only=False)
             
-            if grpc_values and rest_values:
-                # Create individual chart
-                fig, ax = plt.subplots(figsize=(12, 8))
-                
-                x = np.arange(len(scenarios))
-                width = 0.35
-                
-                bars1 = ax.bar(x - width/2, grpc_values, width, label='gRPC', alpha=0.8, color='#FF6B6B')
-                bars2 = ax.bar(x + width/2, rest_values, width, label='REST', alpha=0.8, color='#4ECDC4')
-                
-                ax.set_xlabel('Test Scenario', fontsize=12)
-                ax.set_ylabel(title, fontsize=12)
-                ax.set_title(f'K6 {title}: gRPC vs REST Comparison', fontsize=14, fontweight='bold')
-                ax.set_xticks(x)
-                ax.set_xticklabels(scenarios, rotation=45, ha='right')
-                ax.legend(fontsize=11)
-                ax.grid(True, alpha=0.3)
-                
-                # Add value labels on bars
-                for bar in bars1:
-                    height = bar.get_height()
-                    ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                           f'{height:.2f}', ha='center', va='bottom', fontsize=10)
-                
-                for bar in bars2:
-                    height = bar.get_height()
-                    ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                           f'{height:.2f}', ha='center', va='bottom', fontsize=10)
-                
-                plt.tight_layout()
-                plt.savefig(os.path.join(self.output_dir, 'k6_performance', f'{filename}.png'), 
-                           dpi=300, bbox_inches='tight')
-                plt.close()
-                
-                print(f"    ✅ Created: k6_performance/{filename}.png")
+            if scenarios:
+                # Queue individual chart
+                self._queue_paired_bars(('k6_performance',), filename, ('k6', None),
+                                        scenarios, grpc_values, rest_values,
+                                        title, f'K6 {title}: gRPC vs REST Comparison')
     
     def create_latency_comparison_charts(self):
         """Create separate latency comparison charts for serialize/deserialize operations"""
-        print("  📊 Creating latency comparison charts...")
+        self._log.append("  📊 Creating latency comparison charts...")
+        
+        if not self._has_data('logs', 'order'):
+            return
         
         operations = ['serialize', 'deserialize']
         metrics = ['latency_avg', 'latency_p95', 'latency_p99']
@@ -223,66 +655,24 @@ class MetricsVisualizer:
         for operation in operations:
             for metric in metrics:
                 # Prepare data
-                grpc_values = []
-                rest_values = []
-                scenarios = []
-                
-                for scenario in self.test_scenarios:
-                    grpc_scenario_data = self.metrics_data.get('grpc', {}).get(scenario, {})
-                    rest_scenario_data = self.metrics_data.get('rest', {}).get(scenario, {})
-                    
-                    if ('logs' in grpc_scenario_data and 'order' in grpc_scenario_data['logs'] and
-                    'logs' in rest_scenario_data and 'order' in rest_scenario_data['logs']):
-                        
-                        grpc_latency = grpc_scenario_data['logs']['order'].get(operation, {}).get(metric, 0)
-                        rest_latency = rest_scenario_data['logs']['order'].get(operation, {}).get(metric, 0)
-                        
-                        if grpc_latency > 0 and rest_latency > 0:
-                            grpc_values.append(grpc_latency)
-                            rest_values.append(rest_latency)
-                            scenarios.append(scenario.replace('_', ' ').title())
+                scenarios, grpc_values, rest_values = self._paired_values(
+                    'logs', metric, service='order', operation=operation)
                 
-                if grpc_values and rest_values:
-                    # Create individual chart
-                    fig, ax = plt.subplots(figsize=(12, 8))
-                    
-                    x = np.arange(len(scenarios))
-                    width = 0.35
-                    
-                    bars1 = ax.bar(x - width/2, grpc_values, width, label='gRPC', alpha=0.8, color='#FF6B6B')
-                    bars2 = ax.bar(x + width/2, rest_values, width, label='REST', alpha=0.8, color='#4ECDC4')
-                    
-                    ax.set_xlabel('Test Scenario', fontsize=12)
-                    ax.set_ylabel(f'{operation.title()} {metric.replace("_", " ").title()} (ms)', fontsize=12)
-                    ax.set_title(f'{operation.title()} {metric.replace("_", " ").title()}: gRPC vs REST', fontsize=14, fontweight='bold')
-                    ax.set_xticks(x)
-                    ax.set_xticklabels(scenarios, rotation=45, ha='right')
-                    ax.legend(fontsize=11)
-                    ax.grid(True, alpha=0.3)
-                    
-                    # Add value labels on bars
-                    for bar in bars1:
-                        height = bar.get_height()
-                        ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                               f'{height:.3f}', ha='center', va='bottom', fontsize=10)
-                    
-                    for bar in bars2:
-                        height = bar.get_height()
-                        ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                               f'{height:.3f}', ha='center', va='bottom', fontsize=10)
-                    
-                    # Create filename
+                if scenarios:
+                    # Queue individual chart
                     filename = f'latency_{operation}_{metric}_comparison'
-                    plt.tight_layout()
-                    plt.savefig(os.path.join(self.output_dir, 'latency_comparison', f'{filename}.png'), 
-                               dpi=300, bbox_inches='tight')
-                    plt.close()
-                    
-                    print(f"    ✅ Created: latency_comparison/{filename}.png")
+                    self._queue_paired_bars(('latency_comparison',), filename, ('logs', 'order'),
+                                            scenarios, grpc_values, rest_values,
+                                            f'{operation.title()} {metric.replace("_", " ").title()} (ms)',
+                                            f'{operation.title()} {metric.replace("_", " ").title()}: gRPC vs REST',
+                                            value_format='%.3f')
     
     def create_infrastructure_comparison_charts(self):
         """Create separate infrastructure metrics comparison charts"""
-        print("  📊 Creating infrastructure metrics charts...")
+        self._log.append("  📊 Creating infrastructure metrics charts...")
+        
+        if not self._has_data('infrastructure', 'order'):
+            return
         
         metrics_to_plot = [
             ('cpu_utilization', 'CPU Utilization (%)', 'infrastructure_cpu_comparison'),
@@ -293,64 +683,17 @@ class MetricsVisualizer:
         
         for metric, title, filename in metrics_to_plot:
             # Prepare data
-            grpc_values = []
-            rest_values = []
-            scenarios = []
-            
-            for scenario in self.test_scenarios:
-                grpc_scenario_data = self.metrics_data.get('grpc', {}).get(scenario, {})
-                rest_scenario_data = self.metrics_data.get('rest', {}).get(scenario, {})
-                
-                if ('infrastructure' in grpc_scenario_data and 'order' in grpc_scenario_data['infrastructure'] and
-                    'infrastructure' in rest_scenario_data and 'order' in rest_scenario_data['infrastructure']):
-                    
-                    grpc_value = grpc_scenario_data['infrastructure']['order'].get(metric, {}).get('average_maximum', 0)
-                    rest_value = rest_scenario_data['infrastructure']['order'].get(metric, {}).get('average_maximum', 0)
-                    
-                    if grpc_value > 0 and rest_value > 0:
-                        grpc_values.append(grpc_value)
-                        rest_values.append(rest_value)
-                        scenarios.append(scenario.replace('_', ' ').title())
+            scenarios, grpc_values, rest_values = self._paired_values('infrastructure', metric, service='order')
             
-            if grpc_values and rest_values:
-                # Create individual chart
-                fig, ax = plt.subplots(figsize=(12, 8))
-                
-                x = np.arange(len(scenarios))
-                width = 0.35
-                
-                bars1 = ax.bar(x - width/2, grpc_values, width, label='gRPC', alpha=0.8, color='#FF6B6B')
-                bars2 = ax.bar(x + width/2, rest_values, width, label='REST', alpha=0.8, color='#4ECDC4')
-                
-                ax.set_xlabel('Test Scenario', fontsize=12)
-                ax.set_ylabel(title, fontsize=12)
-                ax.set_title(f'Infrastructure {title}: gRPC vs REST', fontsize=14, fontweight='bold')
-                ax.set_xticks(x)
-                ax.set_xticklabels(scenarios, rotation=45, ha='right')
-                ax.legend(fontsize=11)
-                ax.grid(True, alpha=0.3)
-                
-                # Add value labels on bars
-                for bar in bars1:
-                    height = bar.get_height()
-                    ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                           f'{height:.2f}', ha='center', va='bottom', fontsize=10)
-                
-                for bar in bars2:
-                    height = bar.get_height()
-                    ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                           f'{height:.2f}', ha='center', va='bottom', fontsize=10)
-                
-                plt.tight_layout()
-                plt.savefig(os.path.join(self.output_dir, 'infrastructure_overview', f'{filename}.png'), 
-                           dpi=300, bbox_inches='tight')
-                plt.close()
-                
-                print(f"    ✅ Created: infrastructure_overview/{filename}.png")
+            if scenarios:
+                # Queue individual chart
+                self._queue_paired_bars(('infrastructure_overview',), filename, ('infrastructure', 'order'),
+                                        scenarios, grpc_values, rest_values,
+                                        title, f'Infrastructure {title}: gRPC vs REST')
     
     def create_per_service_infrastructure_charts(self):
         """Create separate infrastructure metrics comparison charts for each service"""
-        print("  📊 Creating per-service infrastructure metrics charts...")
+        self._log.append("  📊 Creating per-service infrastructure metrics charts...")
         
         metrics_to_plot = [
             ('cpu_utilization', 'CPU Utilization (%)', 'infrastructure_cpu'),
@@ -360,140 +703,56 @@ class MetricsVisualizer:
         ]
         
         for service in self.services:
-            print(f"    🔧 Processing {service} service...")
+            self._log.append(f"    🔧 Processing {service} service...")
+            
+            if not self._has_data('infrastructure', service):
+                continue
             
             for metric, title, metric_prefix in metrics_to_plot:
                 # Prepare data
-                grpc_values = []
-                rest_values = []
-                scenarios = []
+                scenarios, grpc_values, rest_values = self._paired_values('infrastructure', metric, service=service)
                 
-                for scenario in self.test_scenarios:
-                    grpc_scenario_data = self.metrics_data.get('grpc', {}).get(scenario, {})
-                    rest_scenario_data = self.metrics_data.get('rest', {}).get(scenario, {})
-                    
-                    if ('infrastructure' in grpc_scenario_data and service in grpc_scenario_data['infrastructure'] and
-                        'infrastructure' in rest_scenario_data and service in rest_scenario_data['infrastructure']):
-                        
-                        grpc_value = grpc_scenario_data['infrastructure'][service].get(metric, {}).get('average_maximum', 0)
-                        rest_value = rest_scenario_data['infrastructure'][service].get(metric, {}).get('average_maximum', 0)
-                        
-                        if grpc_value > 0 and rest_value > 0:
-                            grpc_values.append(grpc_value)
-                            rest_values.append(rest_value)
-                            scenarios.append(scenario.replace('_', ' ').title())
-                
-                if grpc_values and rest_values:
-                    # Create individual chart
-                    fig, ax = plt.subplots(figsize=(12, 8))
-                    
-                    x = np.arange(len(scenarios))
-                    width = 0.35
-                    
-                    bars1 = ax.bar(x - width/2, grpc_values, width, label='gRPC', alpha=0.8, color='#FF6B6B')
-                    bars2 = ax.bar(x + width/2, rest_values, width, label='REST', alpha=0.8, color='#4ECDC4')
-                    
-                    ax.set_xlabel('Test Scenario', fontsize=12)
-                    ax.set_ylabel(title, fontsize=12)
-                    ax.set_title(f'{service.title()} Service - {title}: gRPC vs REST', fontsize=14, fontweight='bold')
-                    ax.set_xticks(x)
-                    ax.set_xticklabels(scenarios, rotation=45, ha='right')
-                    ax.legend(fontsize=11)
-                    ax.grid(True, alpha=0.3)
-                    
-                    # Add value labels on bars
-                    for bar in bars1:
-                        height = bar.get_height()
-                        ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                               f'{height:.2f}', ha='center', va='bottom', fontsize=10)
-                    
-                    for bar in bars2:
-                        height = bar.get_height()
-                        ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                               f'{height:.2f}', ha='center', va='bottom', fontsize=10)
-                    
-                    # Create filename
+                if scenarios:
+                    # Queue individual chart
                     filename = f'{service}_{metric_prefix}_comparison'
-                    plt.tight_layout()
-                    plt.savefig(os.path.join(self.output_dir, 'per_service_infrastructure', service, f'{filename}.png'), 
-                               dpi=300, bbox_inches='tight')
-                    plt.close()
-                    
-                    print(f"      ✅ Created: per_service_infrastructure/{service}/{filename}.png")
+                    self._queue_paired_bars(('per_service_infrastructure', service), filename, ('infrastructure', service),
+                                            scenarios, grpc_values, rest_values,
+                                            title, f'{service.title()} Service - {title}: gRPC vs REST')
     
     def create_per_service_logs_charts(self):
         """Create separate logs metrics comparison charts for each service"""
-        print("  📊 Creating per-service logs metrics charts...")
+        self._log.append("  📊 Creating per-service logs metrics charts...")
         
         operations = ['serialize', 'deserialize']
         metrics = ['latency_avg', 'latency_p95', 'latency_p99', 'total_requests']
         
         for service in self.services:
-            print(f"    🔧 Processing {service} service...")
+            self._log.append(f"    🔧 Processing {service} service...")
+            
+            if not self._has_data('logs', service):
+                continue
             
             for operation in operations:
                 for metric in metrics:
                     # Prepare data
-                    grpc_values = []
-                    rest_values = []
-                    scenarios = []
+                    scenarios, grpc_values, rest_values = self._paired_values(
+                        'logs', metric, service=service, operation=operation)
                     
-                    for scenario in self.test_scenarios:
-                        grpc_scenario_data = self.metrics_data.get('grpc', {}).get(scenario, {})
-                        rest_scenario_data = self.metrics_data.get('rest', {}).get(scenario, {})
-                        
-                        if ('logs' in grpc_scenario_data and service in grpc_scenario_data['logs'] and
-                            'logs' in rest_scenario_data and service in rest_scenario_data['logs']):
-                            
-                            grpc_value = grpc_scenario_data['logs'][service].get(operation, {}).get(metric, 0)
-                            rest_value = rest_scenario_data['logs'][service].get(operation, {}).get(metric, 0)
-                            
-                            if grpc_value > 0 and rest_value > 0:
-                                grpc_values.append(grpc_value)
-                                rest_values.append(rest_value)
-                                scenarios.append(scenario.replace('_', ' ').title())
-                    
-                    if grpc_values and rest_values:
-                        # Create individual chart
-                        fig, ax = plt.subplots(figsize=(12, 8))
-                        
-                        x = np.arange(len(scenarios))
-                        width = 0.35
-                        
-                        bars1 = ax.bar(x - width/2, grpc_values, width, label='gRPC', alpha=0.8, color='#FF6B6B')
-                        bars2 = ax.bar(x + width/2, rest_values, width, label='REST', alpha=0.8, color='#4ECDC4')
-                        
-                        ax.set_xlabel('Test Scenario', fontsize=12)
-                        ax.set_ylabel(f'{operation.title()} {metric.replace("_", " ").title()}', fontsize=12)
-                        ax.set_title(f'{service.title()} Service - {operation.title()} {metric.replace("_", " ").title()}: gRPC vs REST', fontsize=14, fontweight='bold')
-                        ax.set_xticks(x)
-                        ax.set_xticklabels(scenarios, rotation=45, ha='right')
-                        ax.legend(fontsize=11)
-                        ax.grid(True, alpha=0.3)
-                        
-                        # Add value labels on bars
-                        for bar in bars1:
-                            height = bar.get_height()
-                            ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                                   f'{height:.3f}', ha='center', va='bottom', fontsize=10)
-                        
-                        for bar in bars2:
-                            height = bar.get_height()
-                            ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                                   f'{height:.3f}', ha='center', va='bottom', fontsize=10)
-                        
-                        # Create filename
+                    if scenarios:
+                        # Queue individual chart
                         filename = f'{service}_{operation}_{metric}_comparison'
-                        plt.tight_layout()
-                        plt.savefig(os.path.join(self.output_dir, 'per_service_logs', service, f'{filename}.png'), 
-                                   dpi=300, bbox_inches='tight')
-                        plt.close()
-                        
-                        print(f"      ✅ Created: per_service_logs/{service}/{filename}.png")
+                        self._queue_paired_bars(('per_service_logs', service), filename, ('logs', service),
+                                                scenarios, grpc_values, rest_values,
+                                                f'{operation.title()} {metric.replace("_", " ").title()}',
+                                                f'{service.title()} Service - {operation.title()} {metric.replace("_", " ").title()}: gRPC vs REST',
+                                                value_format='%.3f')
     
     def create_service_performance_charts(self):
         """Create separate service-specific performance comparison charts"""
-        print("  📊 Creating service performance charts...")
+        self._log.append("  📊 Creating service performance charts...")
+        
+        if not self._has_data('logs', 'order'):
+            return
         
         # Use order service data for comparison across all scenarios
         metrics_to_plot = [
@@ -503,87 +762,50 @@ class MetricsVisualizer:
             ('total_requests', 'Total Requests', 'service_total_requests_comparison')
         ]
         
+        # Serialize then deserialize series, gRPC before REST
+        series_columns = pd.MultiIndex.from_product([['serialize', 'deserialize'], ['grpc', 'rest']])
+        
         for metric, title, filename in metrics_to_plot:
-            # Prepare data for serialize operation
-            grpc_serialize = []
-            rest_serialize = []
-            grpc_deserialize = []
-            rest_deserialize = []
-            scenarios = []
+            # Prepare data: scenarios as rows, (operation, protocol) series as columns;
+            # keep scenarios where all four series are positive
+            df = self._df
+            mask = ((df['category'] == 'logs') & (df['service'] == 'order') & (df['metric'] == metric) &
+                    df['operation'].isin(['serialize', 'deserialize']))
+            sub = (df.loc[mask]
+                   .pivot(index='scenario', columns=['operation', 'protocol'], values='value')
+                   .reindex(index=self.test_scenarios, columns=series_columns)
+                   .dropna())
+            sub = sub[(sub > 0).all(axis=1)]
             
-            for scenario in self.test_scenarios:
-                grpc_scenario_data = self.metrics_data.get('grpc', {}).get(scenario, {})
-                rest_scenario_data = self.metrics_data.get('rest', {}).get(scenario, {})
-                
-                if ('logs' in grpc_scenario_data and 'order' in grpc_scenario_data['logs'] and
-                    'logs' in rest_scenario_data and 'order' in rest_scenario_data['logs']):
-                    
-                    # Get serialize metrics
-                    grpc_ser = grpc_scenario_data['logs']['order'].get('serialize', {}).get(metric, 0)
-                    rest_ser = rest_scenario_data['logs']['order'].get('serialize', {}).get(metric, 0)
-                    
-                    # Get deserialize metrics
-                    grpc_des = grpc_scenario_data['logs']['order'].get('deserialize', {}).get(metric, 0)
-                    rest_des = rest_scenario_data['logs']['order'].get('deserialize', {}).get(metric, 0)
-                    
-                    if all(v > 0 for v in [grpc_ser, rest_ser, grpc_des, rest_des]):
-                        grpc_serialize.append(grpc_ser)
-                        rest_serialize.append(rest_ser)
-                        grpc_deserialize.append(grpc_des)
-                        rest_deserialize.append(rest_des)
-                        scenarios.append(scenario.replace('_', ' ').title())
+            scenarios = [self._scenario_titles[scenario] for scenario in sub.index]
+            grpc_serialize, rest_serialize, grpc_deserialize, rest_deserialize = sub.to_numpy().T
             
-            if grpc_serialize and rest_serialize:
-                # Create individual chart
-                fig, ax = plt.subplots(figsize=(14, 8))
-                
-                x = np.arange(len(scenarios))
-                width = 0.2
-                
-                bars1 = ax.bar(x - 1.5*width, grpc_serialize, width, label='gRPC Serialize', alpha=0.8, color='#FF6B6B')
-                bars2 = ax.bar(x - 0.5*width, rest_serialize, width, label='REST Serialize', alpha=0.8, color='#4ECDC4')
-                bars3 = ax.bar(x + 0.5*width, grpc_deserialize, width, label='gRPC Deserialize', alpha=0.8, color='#45B7D1')
-                bars4 = ax.bar(x + 1.5*width, rest_deserialize, width, label='REST Deserialize', alpha=0.8, color='#96CEB4')
-                
-                ax.set_xlabel('Test Scenario', fontsize=12)
-                ax.set_ylabel(title, fontsize=12)
-                ax.set_title(f'Service Performance {title}: gRPC vs REST (Order Service)', fontsize=14, fontweight='bold')
-                ax.set_xticks(x)
-                ax.set_xticklabels(scenarios, rotation=45, ha='right')
-                ax.legend(fontsize=11)
-                ax.grid(True, alpha=0.3)
-                
-                # Add value labels on bars
-                for bar in bars1:
-                    height = bar.get_height()
-                    ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                           f'{height:.3f}', ha='center', va='bottom', fontsize=9)
-                
-                for bar in bars2:
-                    height = bar.get_height()
-                    ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                           f'{height:.3f}', ha='center', va='bottom', fontsize=9)
-                
-                for bar in bars3:
-                    height = bar.get_height()
-                    ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                           f'{height:.3f}', ha='center', va='bottom', fontsize=9)
-                
-                for bar in bars4:
-                    height = bar.get_height()
-                    ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                           f'{height:.3f}', ha='center', va='bottom', fontsize=9)
-                
-                plt.tight_layout()
-                plt.savefig(os.path.join(self.output_dir, 'service_performance', f'{filename}.png'), 
-                           dpi=300, bbox_inches='tight')
-                plt.close()
-                
-                print(f"    ✅ Created: service_performance/{filename}.png")
+            path = self._png_path('service_performance', filename)
+            if scenarios and not self._is_current(path, 'logs', 'order'):
+                # Queue individual chart
+                self._queue_chart({
+                    'kind': 'bar',
+                    'name': f'service_performance/{filename}.png',
+                    'path': path,
+                    'figsize': (14, 8),
+                    'width': 0.2,
+                    'scenarios': scenarios,
+                    'series': [
+                        (grpc_serialize, 'gRPC Serialize', self._GRPC_COLOR),
+                        (rest_serialize, 'REST Serialize', self._REST_COLOR),
+                        (grpc_deserialize, 'gRPC Deserialize', '#45B7D1'),
+                        (rest_deserialize, 'REST Deserialize', '#96CEB4')
+                    ],
+                    'ylabel': title,
+                    'title': f'Service Performance {title}: gRPC vs REST (Order Service)',
+                    'value_format': '%.3f',
+                    'label_fontsize': 9,
+                    'dpi': self.dpi
+                })
     
     def create_line_graph_comparisons(self):
         """Create line graphs showing trends across test scenarios"""
-        print("  📊 Creating line graph comparisons...")
+        self._log.append("  📊 Creating line graph comparisons...")
         
         # Create line graphs for key metrics
         self.create_k6_line_graphs()
@@ -591,11 +813,47 @@ class MetricsVisualizer:
         self.create_infrastructure_line_graphs()
         self.create_service_line_graphs()
         
-        print("    ✅ Line graph comparisons created successfully!")
+        self._log.append("    ✅ Line graph comparisons created successfully!")
+    
+    def _plot_trend(self, filename: str, source: Tuple[str, Optional[str]], scenarios: List[str],
+                    grpc_values: np.ndarray, rest_values: np.ndarray, ylabel: str, title: str,
+                    value_format: str = '%.2f'):
+        """
+        Queue a gRPC vs REST line graph across test scenarios for rendering
+        
+        Args:
+            filename: Chart filename in line_graphs/, without the .png extension
+            source: (category, service) the chart values come from, for incremental runs
+            scenarios: Scenario titles along the x axis
+            grpc_values: gRPC value per scenario
+            rest_values: REST value per scenario
+            ylabel: Y axis label
+            title: Chart title
+            value_format: printf-style format of the point value labels
+        """
+        path = self._png_path('line_graphs', filename)
+        if not scenarios or self._is_current(path, *source):
+            return
+        
+        self._queue_chart({
+            'kind': 'line',
+            'name': f'line_graphs/{filename}.png',
+            'path': path,
+            'figsize': (12, 8),
+            'scenarios': scenarios,
+            'series': [(grpc_values, 'gRPC', self._GRPC_COLOR), (rest_values, 'REST', self._REST_COLOR)],
+            'ylabel': ylabel,
+            'title': title,
+            'value_format': value_format,
+            'dpi': self.dpi
+        })
     
     def create_k6_line_graphs(self):
         """Create line graphs for K6 metrics across scenarios"""
-        print("    📈 Creating K6 line graphs...")
+        self._log.append("    📈 Creating K6 line graphs...")
+        
+        if not self._has_data('k6'):
+            return
         
         metrics_to_plot = [
             ('throughput_requests_per_second', 'Throughput (req/s)', 'k6_throughput_trend'),
@@ -607,123 +865,35 @@ class MetricsVisualizer:
         ]
         
         for metric, title, filename in metrics_to_plot:
-            # Prepare data
-            grpc_values = []
-            rest_values = []
-            scenarios = []
-            
-            for scenario in self.test_scenarios:
-                if (scenario in self.metrics_data.get('grpc', {}) and 
-                    'k6' in self.metrics_data['grpc'][scenario] and
-                    metric in self.metrics_data['grpc'][scenario]['k6']):
-                    
-                    grpc_values.append(self.metrics_data['grpc'][scenario]['k6'][metric])
-                    rest_values.append(self.metrics_data['rest'][scenario]['k6'][metric])
-                    scenarios.append(scenario.replace('_', ' ').title())
-            
-            if grpc_values and rest_values:
-                # Create line graph
-                fig, ax = plt.subplots(figsize=(12, 8))
-                
-                x = range(len(scenarios))
-                
-                # Plot lines with markers
-                ax.plot(x, grpc_values, 'o-', linewidth=3, markersize=8, label='gRPC', 
-                       color='#FF6B6B', alpha=0.8)
-                ax.plot(x, rest_values, 's-', linewidth=3, markersize=8, label='REST', 
-                       color='#4ECDC4', alpha=0.8)
-                
-                ax.set_xlabel('Test Scenario', fontsize=12)
-                ax.set_ylabel(title, fontsize=12)
-                ax.set_title(f'K6 {title}: gRPC vs REST Trends', fontsize=14, fontweight='bold')
-                ax.set_xticks(x)
-                ax.set_xticklabels(scenarios, rotation=45, ha='right')
-                ax.legend(fontsize=11)
-                ax.grid(True, alpha=0.3)
-                
-                # Add value labels on points
-                for i, (grpc_val, rest_val) in enumerate(zip(grpc_values, rest_values)):
-                    ax.annotate(f'{grpc_val:.2f}', (i, grpc_val), textcoords="offset points", 
-                               xytext=(0,10), ha='center', fontsize=9, color='#FF6B6B')
-                    ax.annotate(f'{rest_val:.2f}', (i, rest_val), textcoords="offset points", 
-                               xytext=(0,-15), ha='center', fontsize=9, color='#4ECDC4')
-                
-                plt.tight_layout()
-                plt.savefig(os.path.join(self.output_dir, 'line_graphs', f'{filename}.png'), 
-                           dpi=300, bbox_inches='tight')
-                plt.close()
-                
-                print(f"      ✅ Created: line_graphs/{filename}.png")
+            scenarios, grpc_values, rest_values = self._paired_values('k6', metric, positive_only=False)
+            self._plot_trend(filename, ('k6', None), scenarios, grpc_values, rest_values,
+                             title, f'K6 {title}: gRPC vs REST Trends')
     
     def create_latency_line_graphs(self):
         """Create line graphs for latency metrics across scenarios"""
-        print("    📈 Creating latency line graphs...")
+        self._log.append("    📈 Creating latency line graphs...")
+        
+        if not self._has_data('logs', 'order'):
+            return
         
         operations = ['serialize', 'deserialize']
         metrics = ['latency_avg', 'latency_p95', 'latency_p99']
         
         for operation in operations:
             for metric in metrics:
-                # Prepare data
-                grpc_values = []
-                rest_values = []
-                scenarios = []
-                
-                for scenario in self.test_scenarios:
-                    grpc_scenario_data = self.metrics_data.get('grpc', {}).get(scenario, {})
-                    rest_scenario_data = self.metrics_data.get('rest', {}).get(scenario, {})
-                    
-                    if ('logs' in grpc_scenario_data and 'order' in grpc_scenario_data['logs'] and
-                        'logs' in rest_scenario_data and 'order' in rest_scenario_data['logs']):
-                        
-                        grpc_latency = grpc_scenario_data['logs']['order'].get(operation, {}).get(metric, 0)
-                        rest_latency = rest_scenario_data['logs']['order'].get(operation, {}).get(metric, 0)
-                        
-                        if grpc_latency > 0 and rest_latency > 0:
-                            grpc_values.append(grpc_latency)
-                            rest_values.append(rest_latency)
-                            scenarios.append(scenario.replace('_', ' ').title())
-                
-                if grpc_values and rest_values:
-                    # Create line graph
-                    fig, ax = plt.subplots(figsize=(12, 8))
-                    
-                    x = range(len(scenarios))
-                    
-                    # Plot lines with markers
-                    ax.plot(x, grpc_values, 'o-', linewidth=3, markersize=8, label='gRPC', 
-                           color='#FF6B6B', alpha=0.8)
-                    ax.plot(x, rest_values, 's-', linewidth=3, markersize=8, label='REST', 
-                           color='#4ECDC4', alpha=0.8)
-                    
-                    ax.set_xlabel('Test Scenario', fontsize=12)
-                    ax.set_ylabel(f'{operation.title()} {metric.replace("_", " ").title()} (ms)', fontsize=12)
-                    ax.set_title(f'{operation.title()} {metric.replace("_", " ").title()}: gRPC vs REST Trends', 
-                               fontsize=14, fontweight='bold')
-                    ax.set_xticks(x)
-                    ax.set_xticklabels(scenarios, rotation=45, ha='right')
-                    ax.legend(fontsize=11)
-                    ax.grid(True, alpha=0.3)
-                    
-                    # Add value labels on points
-                    for i, (grpc_val, rest_val) in enumerate(zip(grpc_values, rest_values)):
-                        ax.annotate(f'{grpc_val:.3f}', (i, grpc_val), textcoords="offset points", 
-                                   xytext=(0,10), ha='center', fontsize=9, color='#FF6B6B')
-                        ax.annotate(f'{rest_val:.3f}', (i, rest_val), textcoords="offset points", 
-                                   xytext=(0,-15), ha='center', fontsize=9, color='#4ECDC4')
-                    
-                    # Create filename
-                    filename = f'latency_{operation}_{metric}_trend'
-                    plt.tight_layout()
-                    plt.savefig(os.path.join(self.output_dir, 'line_graphs', f'{filename}.png'), 
-                               dpi=300, bbox_inches='tight')
-                    plt.close()
-                    
-                    print(f"      ✅ Created: line_graphs/{filename}.png")
+                scenarios, grpc_values, rest_values = self._paired_values(
+                    'logs', metric, service='order', operation=operation)
+                label = f'{operation.title()} {metric.replace("_", " ").title()}'
+                self._plot_trend(f'latency_{operation}_{metric}_trend', ('logs', 'order'),
+                                 scenarios, grpc_values, rest_values,
+                                 f'{label} (ms)', f'{label}: gRPC vs REST Trends', value_format='%.3f')
     
     def create_infrastructure_line_graphs(self):
         """Create line graphs for infrastructure metrics across scenarios"""
-        print("    📈 Creating infrastructure line graphs...")
+        self._log.append("    📈 Creating infrastructure line graphs...")
+        
+        if not self._has_data('infrastructure', 'order'):
+            return
         
         metrics_to_plot = [
             ('cpu_utilization', 'CPU Utilization (%)', 'infrastructure_cpu_trend'),
@@ -733,63 +903,16 @@ class MetricsVisualizer:
         ]
         
         for metric, title, filename in metrics_to_plot:
-            # Prepare data
-            grpc_values = []
-            rest_values = []
-            scenarios = []
-            
-            for scenario in self.test_scenarios:
-                grpc_scenario_data = self.metrics_data.get('grpc', {}).get(scenario, {})
-                rest_scenario_data = self.metrics_data.get('rest', {}).get(scenario, {})
-                
-                if ('infrastructure' in grpc_scenario_data and 'order' in grpc_scenario_data['infrastructure'] and
-                    'infrastructure' in rest_scenario_data and 'order' in rest_scenario_data['infrastructure']):
-                    
-                    grpc_value = grpc_scenario_data['infrastructure']['order'].get(metric, {}).get('average_maximum', 0)
-                    rest_value = rest_scenario_data['infrastructure']['order'].get(metric, {}).get('average_maximum', 0)
-                    
-                    if grpc_value > 0 and rest_value > 0:
-                        grpc_values.append(grpc_value)
-                        rest_values.append(rest_value)
-                        scenarios.append(scenario.replace('_', ' ').title())
-            
-            if grpc_values and rest_values:
-                # Create line graph
-                fig, ax = plt.subplots(figsize=(12, 8))
-                
-                x = range(len(scenarios))
-                
-                # Plot lines with markers
-                ax.plot(x, grpc_values, 'o-', linewidth=3, markersize=8, label='gRPC', 
-                       color='#FF6B6B', alpha=0.8)
-                ax.plot(x, rest_values, 's-', linewidth=3, markersize=8, label='REST', 
-                       color='#4ECDC4', alpha=0.8)
-                
-                ax.set_xlabel('Test Scenario', fontsize=12)
-                ax.set_ylabel(title, fontsize=12)
-                ax.set_title(f'Infrastructure {title}: gRPC vs REST Trends', fontsize=14, fontweight='bold')
-                ax.set_xticks(x)
-                ax.set_xticklabels(scenarios, rotation=45, ha='right')
-                ax.legend(fontsize=11)
-                ax.grid(True, alpha=0.3)
-                
-                # Add value labels on points
-                for i, (grpc_val, rest_val) in enumerate(zip(grpc_values, rest_values)):
-                    ax.annotate(f'{grpc_val:.2f}', (i, grpc_val), textcoords="offset points", 
-                               xytext=(0,10), ha='center', fontsize=9, color='#FF6B6B')
-                    ax.annotate(f'{rest_val:.2f}', (i, rest_val), textcoords="offset points", 
-                               xytext=(0,-15), ha='center', fontsize=9, color='#4ECDC4')
-                
-                plt.tight_layout()
-                plt.savefig(os.path.join(self.output_dir, 'line_graphs', f'{filename}.png'), 
-                           dpi=300, bbox_inches='tight')
-                plt.close()
-                
-                print(f"      ✅ Created: line_graphs/{filename}.png")
+            scenarios, grpc_values, rest_values = self._paired_values('infrastructure', metric, service='order')
+            self._plot_trend(filename, ('infrastructure', 'order'), scenarios, grpc_values, rest_values,
+                             title, f'Infrastructure {title}: gRPC vs REST Trends')
     
     def create_service_line_graphs(self):
         """Create line graphs for service performance metrics across scenarios"""
-        print("    📈 Creating service performance line graphs...")
+        self._log.append("    📈 Creating service performance line graphs...")
+        
+        if not self._has_data('logs', 'order'):
+            return
         
         metrics_to_plot = [
             ('latency_avg', 'Average Latency (ms)', 'service_latency_avg_trend'),
@@ -799,109 +922,55 @@ class MetricsVisualizer:
         ]
         
         for metric, title, filename in metrics_to_plot:
-            # Prepare data
-            grpc_values = []
-            rest_values = []
-            scenarios = []
-            
-            for scenario in self.test_scenarios:
-                grpc_scenario_data = self.metrics_data.get('grpc', {}).get(scenario, {})
-                rest_scenario_data = self.metrics_data.get('rest', {}).get(scenario, {})
-                
-                if ('logs' in grpc_scenario_data and 'order' in grpc_scenario_data['logs'] and
-                    'logs' in rest_scenario_data and 'order' in rest_scenario_data['logs']):
-                    
-                    grpc_value = grpc_scenario_data['logs']['order'].get('serialize', {}).get(metric, 0)
-                    rest_value = rest_scenario_data['logs']['order'].get('serialize', {}).get(metric, 0)
-                    
-                    if grpc_value > 0 and rest_value > 0:
-                        grpc_values.append(grpc_value)
-                        rest_values.append(rest_value)
-                        scenarios.append(scenario.replace('_', ' ').title())
-            
-            if grpc_values and rest_values:
-                # Create line graph
-                fig, ax = plt.subplots(figsize=(12, 8))
-                
-                x = range(len(scenarios))
-                
-                # Plot lines with markers
-                ax.plot(x, grpc_values, 'o-', linewidth=3, markersize=8, label='gRPC', 
-                       color='#FF6B6B', alpha=0.8)
-                ax.plot(x, rest_values, 's-', linewidth=3, markersize=8, label='REST', 
-                       color='#4ECDC4', alpha=0.8)
-                
-                ax.set_xlabel('Test Scenario', fontsize=12)
-                ax.set_ylabel(title, fontsize=12)
-                ax.set_title(f'Service Performance {title}: gRPC vs REST Trends', fontsize=14, fontweight='bold')
-                ax.set_xticks(x)
-                ax.set_xticklabels(scenarios, rotation=45, ha='right')
-                ax.legend(fontsize=11)
-                ax.grid(True, alpha=0.3)
-                
-                # Add value labels on points
-                for i, (grpc_val, rest_val) in enumerate(zip(grpc_values, rest_values)):
-                    ax.annotate(f'{grpc_val:.3f}', (i, grpc_val), textcoords="offset points", 
-                               xytext=(0,10), ha='center', fontsize=9, color='#FF6B6B')
-                    ax.annotate(f'{rest_val:.3f}', (i, rest_val), textcoords="offset points", 
-                               xytext=(0,-15), ha='center', fontsize=9, color='#4ECDC4')
-                
-                plt.tight_layout()
-                plt.savefig(os.path.join(self.output_dir, 'line_graphs', f'{filename}.png'), 
-                           dpi=300, bbox_inches='tight')
-                plt.close()
-                
-                print(f"      ✅ Created: line_graphs/{filename}.png")
+            scenarios, grpc_values, rest_values = self._paired_values(
+                'logs', metric, service='order', operation='serialize')
+            self._plot_trend(filename, ('logs', 'order'), scenarios, grpc_values, rest_values,
+                             title, f'Service Performance {title}: gRPC vs REST Trends', value_format='%.3f')
+
     
     def create_summary_dashboard(self):
         """Create a summary dashboard with key metrics"""
         print("📈 Creating summary dashboard...")
         
-        # Create a comprehensive summary table
-        summary_data = []
+        # Summary columns: (label, category, service, operation, metric, value format)
+        columns = [
+            ('Throughput (req/s)', 'k6', None, None, 'throughput_requests_per_second', '%.2f'),
+            ('Avg Duration (ms)', 'k6', None, None, 'request_duration_avg', '%.2f'),
+            ('P95 Duration (ms)', 'k6', None, None, 'request_duration_p95', '%.2f'),
+            ('Serialize Latency (ms)', 'logs', 'order', 'serialize', 'latency_avg', '%.3f'),
+            ('Deserialize Latency (ms)', 'logs', 'order', 'deserialize', 'latency_avg', '%.3f'),
+            ('CPU Utilization (%)', 'infrastructure', 'order', None, 'cpu_utilization', '%.2f'),
+            ('Memory Utilization (%)', 'infrastructure', 'order', None, 'memory_utilization', '%.2f')
+        ]
+        selection = pd.DataFrame([column[:5] for column in columns],
+                                 columns=['label', 'category', 'service', 'operation', 'metric'])
         
-        for protocol in self.protocols:
-            for scenario in self.test_scenarios:
-                if scenario in self.metrics_data.get(protocol, {}):
-                    scenario_data = self.metrics_data[protocol][scenario]
-                    
-                    # K6 metrics
-                    k6_metrics = scenario_data.get('k6', {})
-                    throughput = k6_metrics.get('throughput_requests_per_second', 0)
-                    avg_duration = k6_metrics.get('request_duration_avg', 0)
-                    p95_duration = k6_metrics.get('request_duration_p95', 0)
-                    
-                    # Latency metrics (order service)
-                    logs_metrics = scenario_data.get('logs', {}).get('order', {})
-                    serialize_avg = logs_metrics.get('serialize', {}).get('latency_avg', 0)
-                    deserialize_avg = logs_metrics.get('deserialize', {}).get('latency_avg', 0)
-                    
-                    # Infrastructure metrics (order service)
-                    infra_metrics = scenario_data.get('infrastructure', {}).get('order', {})
-                    cpu_util = infra_metrics.get('cpu_utilization', {}).get('average_maximum', 0)
-                    memory_util = infra_metrics.get('memory_utilization', {}).get('average_maximum', 0)
-                    
-                    summary_data.append({
-                        'Protocol': protocol.upper(),
-                        'Test Scenario': scenario.replace('_', ' ').title(),
-                        'Throughput (req/s)': f"{throughput:.2f}",
-                        'Avg Duration (ms)': f"{avg_duration:.2f}",
-                        'P95 Duration (ms)': f"{p95_duration:.2f}",
-                        'Serialize Latency (ms)': f"{serialize_avg:.3f}",
-                        'Deserialize Latency (ms)': f"{deserialize_avg:.3f}",
-                        'CPU Utilization (%)': f"{cpu_util:.2f}",
-                        'Memory Utilization (%)': f"{memory_util:.2f}"
-                    })
+        # One row per loaded test, in protocol then scenario order; missing metrics read as 0
+        tests = pd.MultiIndex.from_tuples(
+            [(protocol, scenario) for protocol in self.protocols for scenario in self.test_scenarios
+             if scenario in self.metrics_data.get(protocol, {})],
+            names=['protocol', 'scenario'])
         
         # Create summary table
-        if summary_data:
-            df = pd.DataFrame(summary_data)
+        if len(tests):
+            summary = (self._df.merge(selection, on=['category', 'service', 'operation', 'metric'])
+                       .pivot_table(index=['protocol', 'scenario'], columns='label', values='value')
+                       .reindex(index=tests, columns=selection['label'])
+                       .fillna(0))
+            
+            df = pd.DataFrame({
+                'Protocol': tests.get_level_values('protocol').str.upper(),
+                'Test Scenario': tests.get_level_values('scenario').map(self._scenario_titles)
+            })
+            for label, *_, value_format in columns:
+                df[label] = np.char.mod(value_format, summary[label].to_numpy())
             
             fig, ax = plt.subplots(figsize=(16, 8))
             ax.axis('tight')
             ax.axis('off')
             
-            table = ax.table(cellText=df.values, colLabels=df.columns, cellLoc='center', loc='center')
+            table = ax.table(cellText=df.to_numpy(dtype=object, copy=False), colLabels=df.columns.to_list(),
+                             cellLoc='center', loc='center')
             table.auto_set_font_size(False)
             table.set_fontsize(9)
             table.scale(1.2, 1.5)
@@ -912,17 +981,37 @@ class MetricsVisualizer:
                 table[(0, i)].set_text_props(weight='bold', color='white')
             
             plt.title('Performance Metrics Summary Dashboard', fontsize=16, fontweight='bold', pad=20)
-            plt.tight_layout()
-            plt.savefig(os.path.join(self.output_dir, 'summary_dashboard.png'), 
-                       dpi=300, bbox_inches='tight')
+            plt.savefig(self._png_path('summary_dashboard'), dpi=self.dpi, bbox_inches='tight',
+                        pil_kwargs=_PNG_OPTIONS)
             plt.close()
             
             # Save summary as CSV
             csv_path = os.path.join(self.output_dir, 'performance_summary.csv')
             df.to_csv(csv_path, index=False)
-            print(f"  📁 Summary dashboard saved to: {os.path.join(self.output_dir, 'summary_dashboard.png')}")
+            print(f"  📁 Summary dashboard saved to: {self._png_path('summary_dashboard')}")
             print(f"  📁 Summary CSV saved to: {csv_path}")
     
+    def _format_output_tree(self) -> str:
+        """Describe the generated output folders as a single printable block
+
+        Returns:
+            Multi-line listing of every folder and file under the output directory
+        """
+        lines = ["📊 Generated charts organized in folders:"]
+        root_files = []
+        for root, dirs, files in os.walk(self.output_dir):
+            dirs.sort()
+            depth = len(Path(root).relative_to(self.output_dir).parts)
+            if depth == 0:
+                root_files = sorted(files)
+                continue
+            indent = '  ' * depth
+            lines.append(f"{indent} 📁 {os.path.basename(root)}/")
+            lines.extend(f"{indent}   - {name}" for name in sorted(files))
+        lines.append("   📁 Summary files (root):")
+        lines.extend(f"     - {name}" for name in root_files)
+        return '\n'.join(lines) + '\n'
+
     def generate_all_visualizations(self):
         """Generate all visualization types"""
         print("🎨 Starting visualization generation...")
@@ -936,113 +1025,7 @@ class MetricsVisualizer:
             
             print(f"\n✅ All visualizations generated successfully!")
             print(f"📁 Output directory: {self.output_dir}")
-            print(f"📊 Generated charts organized in folders:")
-            print(f"   📁 k6_performance/")
-            print(f"     - k6_throughput_comparison.png")
-            print(f"     - k6_avg_duration_comparison.png")
-            print(f"     - k6_p95_duration_comparison.png")
-            print(f"     - k6_data_sent_comparison.png")
-            print(f"     - k6_data_received_comparison.png")
-            print(f"     - k6_vus_max_comparison.png")
-            print(f"   📁 latency_comparison/")
-            print(f"     - latency_serialize_latency_avg_comparison.png")
-            print(f"     - latency_serialize_latency_p95_comparison.png")
-            print(f"     - latency_serialize_latency_p99_comparison.png")
-            print(f"     - latency_deserialize_latency_avg_comparison.png")
-            print(f"     - latency_deserialize_latency_p95_comparison.png")
-            print(f"     - latency_deserialize_latency_p99_comparison.png")
-            print(f"   📁 infrastructure_overview/")
-            print(f"     - infrastructure_cpu_comparison.png")
-            print(f"     - infrastructure_memory_comparison.png")
-            print(f"     - infrastructure_network_rx_comparison.png")
-            print(f"     - infrastructure_network_tx_comparison.png")
-            print(f"   📁 service_performance/")
-            print(f"     - service_latency_avg_comparison.png")
-            print(f"     - service_latency_p95_comparison.png")
-            print(f"     - service_latency_p99_comparison.png")
-            print(f"     - service_total_requests_comparison.png")
-            print(f"   📁 per_service_infrastructure/")
-            print(f"     📁 order/")
-            print(f"       - order_infrastructure_cpu_comparison.png")
-            print(f"       - order_infrastructure_memory_comparison.png")
-            print(f"       - order_infrastructure_network_rx_comparison.png")
-            print(f"       - order_infrastructure_network_tx_comparison.png")
-            print(f"     📁 product/")
-            print(f"       - product_infrastructure_cpu_comparison.png")
-            print(f"       - product_infrastructure_memory_comparison.png")
-            print(f"       - product_infrastructure_network_rx_comparison.png")
-            print(f"       - product_infrastructure_network_tx_comparison.png")
-            print(f"     📁 user/")
-            print(f"       - user_infrastructure_cpu_comparison.png")
-            print(f"       - user_infrastructure_memory_comparison.png")
-            print(f"       - user_infrastructure_network_rx_comparison.png")
-            print(f"       - user_infrastructure_network_tx_comparison.png")
-            print(f"     📁 payment/")
-            print(f"       - payment_infrastructure_cpu_comparison.png")
-            print(f"       - payment_infrastructure_memory_comparison.png")
-            print(f"       - payment_infrastructure_network_rx_comparison.png")
-            print(f"       - payment_infrastructure_network_tx_comparison.png")
-            print(f"   📁 per_service_logs/")
-            print(f"     📁 order/")
-            print(f"       - order_serialize_latency_avg_comparison.png")
-            print(f"       - order_serialize_latency_p95_comparison.png")
-            print(f"       - order_serialize_latency_p99_comparison.png")
-            print(f"       - order_serialize_total_requests_comparison.png")
-            print(f"       - order_deserialize_latency_avg_comparison.png")
-            print(f"       - order_deserialize_latency_p95_comparison.png")
-            print(f"       - order_deserialize_latency_p99_comparison.png")
-            print(f"       - order_deserialize_total_requests_comparison.png")
-            print(f"     📁 product/")
-            print(f"       - product_serialize_latency_avg_comparison.png")
-            print(f"       - product_serialize_latency_p95_comparison.png")
-            print(f"       - product_serialize_latency_p99_comparison.png")
-            print(f"       - product_serialize_total_requests_comparison.png")
-            print(f"       - product_deserialize_latency_avg_comparison.png")
-            print(f"       - product_deserialize_latency_p95_comparison.png")
-            print(f"       - product_deserialize_latency_p99_comparison.png")
-            print(f"       - product_deserialize_total_requests_comparison.png")
-            print(f"     📁 user/")
-            print(f"       - user_serialize_latency_avg_comparison.png")
-            print(f"       - user_serialize_latency_p95_comparison.png")
-            print(f"       - user_serialize_latency_p99_comparison.png")
-            print(f"       - user_serialize_total_requests_comparison.png")
-            print(f"       - user_deserialize_latency_avg_comparison.png")
-            print(f"       - user_deserialize_latency_p95_comparison.png")
-            print(f"       - user_deserialize_latency_p99_comparison.png")
-            print(f"       - user_deserialize_total_requests_comparison.png")
-            print(f"     📁 payment/")
-            print(f"       - payment_serialize_latency_avg_comparison.png")
-            print(f"       - payment_serialize_latency_p95_comparison.png")
-            print(f"       - payment_serialize_latency_p99_comparison.png")
-            print(f"       - payment_serialize_total_requests_comparison.png")
-            print(f"       - payment_deserialize_latency_avg_comparison.png")
-            print(f"       - payment_deserialize_latency_p95_comparison.png")
-            print(f"       - payment_deserialize_latency_p99_comparison.png")
-            print(f"       - payment_deserialize_total_requests_comparison.png")
-            print(f"   📁 line_graphs/")
-            print(f"     - k6_throughput_trend.png")
-            print(f"     - k6_avg_duration_trend.png")
-            print(f"     - k6_p95_duration_trend.png")
-            print(f"     - k6_data_sent_trend.png")
-            print(f"     - k6_data_received_trend.png")
-            print(f"     - k6_vus_max_trend.png")
-            print(f"     - latency_serialize_latency_avg_trend.png")
-            print(f"     - latency_serialize_latency_p95_trend.png")
-            print(f"     - latency_serialize_latency_p99_trend.png")
-            print(f"     - latency_deserialize_latency_avg_trend.png")
-            print(f"     - latency_deserialize_latency_p95_trend.png")
-            print(f"     - latency_deserialize_latency_p99_trend.png")
-            print(f"     - infrastructure_cpu_trend.png")
-            print(f"     - infrastructure_memory_trend.png")
-            print(f"     - infrastructure_network_rx_trend.png")
-            print(f"     - infrastructure_network_tx_trend.png")
-            print(f"     - service_latency_avg_trend.png")
-            print(f"     - service_latency_p95_trend.png")
-            print(f"     - service_latency_p99_trend.png")
-            print(f"     - service_total_requests_trend.png")
-            print(f"   📁 Summary files (root):")
-            print(f"     - summary_dashboard.png")
-            print(f"     - performance_summary.csv")
+            sys.stdout.write(self._format_output_tree())
             
         except Exception as e:
             print(f"❌ Error generating visualizations: {e}")
@@ -1059,6 +1042,10 @@ def main():
                        help='Directory containing extracted metrics (default: extracted_metrics)')
     parser.add_argument('--output-dir', default='visualizations', 
                        help='Directory to save generated charts (default: visualizations)')
+    parser.add_argument('--dpi', type=int, default=120,
+                       help='Resolution of the saved charts (default: 120)')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Skip comparison charts that are newer than every metrics file they use and match --dpi')
     
     args = parser.parse_args()
     
@@ -1073,7 +1060,8 @@ def main():
     print(f"📁 Output directory: {args.output_dir}")
     
     # Create visualizer and generate charts
-    visualizer = MetricsVisualizer(args.metrics_dir, args.output_dir)
+    visualizer = MetricsVisualizer(args.metrics_dir, args.output_dir, incremental=args.incremental,
+                                   dpi=args.dpi)
     visualizer.generate_all_visualizations()
 
 
@@ -5,162 +5,42 @@ Extracts and averages CPU, memory, and network metrics from CloudWatch JSON file
 """
 
 import json
+import numpy as np
 import sys
 import os
-import glob
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
+from json_loading import with_json
 
-def extract_cpu_metrics(json_file_path: str) -> float:
-    """
-    Extract maximum CPU utilization from CloudWatch CPU metrics file
-    
-    Args:
-        json_file_path: Path to the CPU metrics JSON file
-        
-    Returns:
-        Average maximum CPU utilization
-    """
-    try:
-        with open(json_file_path, 'r') as file:
-            data = json.load(file)
-    except FileNotFoundError:
-        print(f"Error: File '{json_file_path}' not found")
-        return 0.0
-    except json.JSONDecodeError:
-        print(f"Error: Invalid JSON in file '{json_file_path}'")
-        return 0.0
-    
-    if 'Datapoints' not in data:
-        print(f"Error: No 'Datapoints' found in file '{json_file_path}'")
-        return 0.0
-    
-    # Extract maximum CPU utilization values
-    max_values = []
-    for datapoint in data['Datapoints']:
-        if 'Maximum' in datapoint:
-            max_values.append(datapoint['Maximum'])
-    
-    if not max_values:
-        print(f"Warning: No maximum values found in '{json_file_path}'")
-        return 0.0
-    
-    # Calculate average
-    return sum(max_values) / len(max_values)
-
-
-def extract_memory_metrics(json_file_path: str) -> float:
-    """
-    Extract maximum memory utilization from CloudWatch memory metrics file
-    
-    Args:
-        json_file_path: Path to the memory metrics JSON file
-        
-    Returns:
-        Average maximum memory utilization
-    """
-    try:
-        with open(json_file_path, 'r') as file:
-            data = json.load(file)
-    except FileNotFoundError:
-        print(f"Error: File '{json_file_path}' not found")
-        return 0.0
-    except json.JSONDecodeError:
-        print(f"Error: Invalid JSON in file '{json_file_path}'")
-        return 0.0
-    
-    if 'Datapoints' not in data:
-        print(f"Error: No 'Datapoints' found in file '{json_file_path}'")
-        return 0.0
-    
-    # Extract maximum memory utilization values
-    max_values = []
-    for datapoint in data['Datapoints']:
-        if 'Maximum' in datapoint:
-            max_values.append(datapoint['Maximum'])
-    
-    if not max_values:
-        print(f"Warning: No maximum values found in '{json_file_path}'")
-        return 0.0
-    
-    # Calculate average
-    return sum(max_values) / len(max_values)
 
-
-def extract_network_rx_metrics(json_file_path: str) -> float:
-    """
-    Extract maximum network RX bytes from CloudWatch network metrics file
-    
-    Args:
-        json_file_path: Path to the network RX metrics JSON file
-        
-    Returns:
-        Average maximum network RX bytes
+@with_json(default=0.0)
+def extract_max_average(json_file_path: str, data: Dict[str, Any]) -> float:
     """
-    try:
-        with open(json_file_path, 'r') as file:
-            data = json.load(file)
-    except FileNotFoundError:
-        print(f"Error: File '{json_file_path}' not found")
-        return 0.0
-    except json.JSONDecodeError:
-        print(f"Error: Invalid JSON in file '{json_file_path}'")
-        return 0.0
-    
-    if 'Datapoints' not in data:
-        print(f"Error: No 'Datapoints' found in file '{json_file_path}'")
-        return 0.0
+    Extract the average of the Maximum statistic from a CloudWatch metrics file
     
-    # Extract maximum network RX bytes values
-    max_values = []
-    for datapoint in data['Datapoints']:
-        if 'Maximum' in datapoint:
-            max_values.append(datapoint['Maximum'])
-    
-    if not max_values:
-        print(f"Warning: No maximum values found in '{json_file_path}'")
-        return 0.0
-    
-    # Calculate average
-    return sum(max_values) / len(max_values)
-
-
-def extract_network_tx_metrics(json_file_path: str) -> float:
-    """
-    Extract maximum network TX bytes from CloudWatch network metrics file
+    Used for every collected metric (CPU, memory, network RX and TX).
     
     Args:
-        json_file_path: Path to the network TX metrics JSON file
+        json_file_path: Path to the CloudWatch metrics JSON file
+        data: Parsed CloudWatch metrics, supplied by with_json
         
     Returns:
-        Average maximum network TX bytes
+        Average of the datapoints' maximum values
     """
-    try:
-        with open(json_file_path, 'r') as file:
-            data = json.load(file)
-    except FileNotFoundError:
-        print(f"Error: File '{json_file_path}' not found")
-        return 0.0
-    except json.JSONDecodeError:
-        print(f"Error: Invalid JSON in file '{json_file_path}'")
-        return 0.0
-    
     if 'Datapoints' not in data:
         print(f"Error: No 'Datapoints' found in file '{json_file_path}'")
         return 0.0
     
-    # Extract maximum network TX bytes values
-    max_values = []
-    for datapoint in data['Datapoints']:
-        if 'Maximum' in datapoint:
-            max_values.append(datapoint['Maximum'])
+    # Pull the Maximum column straight into a float array
+    max_values = np.fromiter((datapoint['Maximum'] for datapoint in data['Datapoints'] if 'Maximum' in datapoint),
+                             dtype=np.float64)
     
-    if not max_values:
+    if not max_values.size:
         print(f"Warning: No maximum values found in '{json_file_path}'")
         return 0.0
     
     # Calculate average
-    return sum(max_values) / len(max_values)
+    return float(max_values.mean())
 
 
 def save_metrics_to_file(metrics: Dict[str, Any], output_file: str):
@@ -185,7 +65,7 @@ def process_cloudwatch_metrics(folder_path: str, output_file: str):
     
     Args:
         folder_path: Path to the folder containing CloudWatch metrics files
-        output_file: Name of the output file for combined metrics
+        output_file: Path of the output file for combined metrics
     """
     if not os.path.isdir(folder_path):
         print(f"Error: '{folder_path}' is not a valid directory")
@@ -194,22 +74,41 @@ def process_cloudwatch_metrics(folder_path: str, output_file: str):
     print(f"Processing CloudWatch metrics in: {folder_path}")
     
     # Find all metrics files
-    cpu_files = glob.glob(os.path.join(folder_path, "*_cpu_metrics.json"))
-    memory_files = glob.glob(os.path.join(folder_path, "*_memory_metrics.json"))
-    network_rx_files = glob.glob(os.path.join(folder_path, "*_network_rx_bytes_metrics.json"))
-    network_tx_files = glob.glob(os.path.join(folder_path, "*_network_tx_bytes_metrics.json"))
+    cpu_files = []
+    memory_files = []
+    network_rx_files = []
+    network_tx_files = []
+    file_groups = [
+        ('_cpu_metrics.json', cpu_files),
+        ('_memory_metrics.json', memory_files),
+        ('_network_rx_bytes_metrics.json', network_rx_files),
+        ('_network_tx_bytes_metrics.json', network_tx_files)
+    ]
+    
+    # One directory pass sorts files into their metric (names like *_cpu_metrics.json)
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if entry.name.startswith('.') or not entry.is_file():
+                continue
+            for suffix, files in file_groups:
+                if entry.name.endswith(suffix):
+                    files.append(entry.path)
+                    break
     
     print(f"Found {len(cpu_files)} CPU metrics files")
     print(f"Found {len(memory_files)} memory metrics files")
     print(f"Found {len(network_rx_files)} network RX metrics files")
     print(f"Found {len(network_tx_files)} network TX metrics files")
     
+    # Files are small and few per service, so they are parsed serially: starting worker
+    # processes would cost more than the parsing
+    
     # Process CPU metrics
     cpu_values = []
     for file_path in cpu_files:
         file_name = os.path.basename(file_path)
         print(f"  Processing CPU: {file_name}")
-        value = extract_cpu_metrics(file_path)
+        value = extract_max_average(file_path)
         if value > 0:
             cpu_values.append(value)
     
@@ -218,7 +117,7 @@ def process_cloudwatch_metrics(folder_path: str, output_file: str):
     for file_path in memory_files:
         file_name = os.path.basename(file_path)
         print(f"  Processing memory: {file_name}")
-        value = extract_memory_metrics(file_path)
+        value = extract_max_average(file_path)
         if value > 0:
             memory_values.append(value)
     
@@ -227,7 +126,7 @@ def process_cloudwatch_metrics(folder_path: str, output_file: str):
     for file_path in network_rx_files:
         file_name = os.path.basename(file_path)
         print(f"  Processing network RX: {file_name}")
-        value = extract_network_rx_metrics(file_path)
+        value = extract_max_average(file_path)
         if value > 0:
             network_rx_values.append(value)
     
@@ -236,7 +135,7 @@ def process_cloudwatch_metrics(folder_path: str, output_file: str):
     for file_path in network_tx_files:
         file_name = os.path.basename(file_path)
         print(f"  Processing network TX: {file_name}")
-        value = extract_network_tx_metrics(file_path)
+        value = extract_max_average(file_path)
         if value > 0:
             network_tx_values.append(value)
     
@@ -273,8 +172,7 @@ def process_cloudwatch_metrics(folder_path: str, output_file: str):
     
     # Save metrics
     if metrics:
-        output_path = os.path.join(folder_path, output_file)
-        save_metrics_to_file(metrics, output_path)
+        save_metrics_to_file(metrics, output_file)
         print(f"\nProcessed metrics successfully:")
         print(f"  CPU files: {len(cpu_values)}")
         print(f"  Memory files: {len(memory_values)}")
@@ -284,20 +182,30 @@ def process_cloudwatch_metrics(folder_path: str, output_file: str):
         print("No metrics extracted")
 
 
-def main():
-    """Main function to process command line arguments and extract metrics"""
-    if len(sys.argv) < 2:
-        print("Usage: python extract_cloudwatch_metrics.py <folder_path>")
-        sys.exit(1)
+def run(folder_path: str, output_file: Optional[str] = None):
+    """
+    Extract the CloudWatch metrics of a service folder and save them to average_cloudwatch_metrics.json
     
-    folder_path = sys.argv[1]
-
+    Args:
+        folder_path: Path to the folder containing CloudWatch metrics files
+        output_file: Where to save the metrics instead (e.g. in run_all_extractions' output directory)
+    """
     if not os.path.isdir(folder_path):
         print(f"Error: '{folder_path}' is not a valid directory")
         sys.exit(1)
 
     # Process CloudWatch metrics
-    process_cloudwatch_metrics(folder_path, "average_cloudwatch_metrics.json")
+    output_file = output_file or os.path.join(folder_path, "average_cloudwatch_metrics.json")
+    process_cloudwatch_metrics(folder_path, output_file)
+
+
+def main():
+    """Main function to process command line arguments and extract metrics"""
+    if len(sys.argv) < 2:
+        print("Usage: python extract_cloudwatch_metrics.py <folder_path>")
+        sys.exit(1)
+    
+    run(sys.argv[1])
 
 
 if __name__ == "__main__":
@@ -5,91 +5,80 @@ Extracts key performance metrics from k6 test result JSON files
 """
 
 import json
+import numpy as np
 import sys
 import os
 import glob
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
-def extract_k6_metrics(json_file_path: str) -> Dict[str, Any]:
+from json_loading import map_captured, with_json
+
+@with_json(default={})
+def extract_k6_metrics(json_file_path: str, data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Extract key metrics from k6 test results JSON file (supports both REST and gRPC)
     
     Args:
         json_file_path: Path to the k6 results JSON file
+        data: Parsed k6 results, supplied by with_json
         
     Returns:
         Dictionary containing extracted metrics (flattened structure)
     """
-    try:
-        with open(json_file_path, 'r') as file:
-            data = json.load(file)
-    except FileNotFoundError:
-        print(f"Error: File '{json_file_path}' not found")
-        return {}
-    except json.JSONDecodeError:
-        print(f"Error: Invalid JSON in file '{json_file_path}'")
-        return {}
-    
     metrics = {}
     
+    # k6 summary exports are small, so the whole document is parsed; look the metrics table up once
+    k6_metrics = data.get('metrics', {})
+    
     # Detect protocol type (REST vs gRPC)
-    is_grpc = 'grpc_req_duration' in data.get('metrics', {})
-    is_rest = 'http_req_duration' in data.get('metrics', {})
+    is_grpc = 'grpc_req_duration' in k6_metrics
+    is_rest = 'http_req_duration' in k6_metrics
     
     # Extract data_sent and data_received
-    if 'data_sent' in data.get('metrics', {}):
-        data_sent = data['metrics']['data_sent']
-        metrics['data_sent_count'] = data_sent.get('values', {}).get('count', 0)
-        metrics['data_sent_rate'] = data_sent.get('values', {}).get('rate', 0)
+    if 'data_sent' in k6_metrics:
+        data_sent = k6_metrics['data_sent'].get('values', {})
+        metrics['data_sent_count'] = data_sent.get('count', 0)
+        metrics['data_sent_rate'] = data_sent.get('rate', 0)
     
-    if 'data_received' in data.get('metrics', {}):
-        data_received = data['metrics']['data_received']
-        metrics['data_received_count'] = data_received.get('values', {}).get('count', 0)
-        metrics['data_received_rate'] = data_received.get('values', {}).get('rate', 0)
+    if 'data_received' in k6_metrics:
+        data_received = k6_metrics['data_received'].get('values', {})
+        metrics['data_received_count'] = data_received.get('count', 0)
+        metrics['data_received_rate'] = data_received.get('rate', 0)
     
     # Extract request duration metrics (REST or gRPC)
-    if is_rest and 'http_req_duration' in data.get('metrics', {}):
-        req_duration = data['metrics']['http_req_duration']
-        metrics['request_duration_avg'] = req_duration.get('values', {}).get('avg', 0)
-        metrics['request_duration_min'] = req_duration.get('values', {}).get('min', 0)
-        metrics['request_duration_max'] = req_duration.get('values', {}).get('max', 0)
-        metrics['request_duration_median'] = req_duration.get('values', {}).get('med', 0)
-        metrics['request_duration_p90'] = req_duration.get('values', {}).get('p(90)', 0)
-        metrics['request_duration_p95'] = req_duration.get('values', {}).get('p(95)', 0)
-        metrics['request_duration_p99'] = req_duration.get('values', {}).get('p(99)', 0)
-    elif is_grpc and 'grpc_req_duration' in data.get('metrics', {}):
-        req_duration = data['metrics']['grpc_req_duration']
-        metrics['request_duration_avg'] = req_duration.get('values', {}).get('avg', 0)
-        metrics['request_duration_min'] = req_duration.get('values', {}).get('min', 0)
-        metrics['request_duration_max'] = req_duration.get('values', {}).get('max', 0)
-        metrics['request_duration_median'] = req_duration.get('values', {}).get('med', 0)
-        metrics['request_duration_p90'] = req_duration.get('values', {}).get('p(90)', 0)
-        metrics['request_duration_p95'] = req_duration.get('values', {}).get('p(95)', 0)
-        metrics['request_duration_p99'] = req_duration.get('values', {}).get('p(99)', 0)
+    duration_metric = 'http_req_duration' if is_rest else 'grpc_req_duration' if is_grpc else None
+    if duration_metric:
+        req_duration = k6_metrics[duration_metric].get('values', {})
+        metrics['request_duration_avg'] = req_duration.get('avg', 0)
+        metrics['request_duration_min'] = req_duration.get('min', 0)
+        metrics['request_duration_max'] = req_duration.get('max', 0)
+        metrics['request_duration_median'] = req_duration.get('med', 0)
+        metrics['request_duration_p90'] = req_duration.get('p(90)', 0)
+        metrics['request_duration_p95'] = req_duration.get('p(95)', 0)
+        metrics['request_duration_p99'] = req_duration.get('p(99)', 0)
     
     # Extract VUs (Virtual Users) max
-    if 'vus_max' in data.get('metrics', {}):
-        vus_max = data['metrics']['vus_max']
-        metrics['vus_max'] = vus_max.get('values', {}).get('value', 0)
+    if 'vus_max' in k6_metrics:
+        metrics['vus_max'] = k6_metrics['vus_max'].get('values', {}).get('value', 0)
     
     # Extract throughput (requests per second) - REST or gRPC
-    if is_rest and 'http_reqs' in data.get('metrics', {}):
-        http_reqs = data['metrics']['http_reqs']
-        metrics['throughput_requests_per_second'] = http_reqs.get('values', {}).get('rate', 0)
-        metrics['throughput_total_requests'] = http_reqs.get('values', {}).get('count', 0)
-    elif is_grpc and 'iterations' in data.get('metrics', {}):
+    if is_rest and 'http_reqs' in k6_metrics:
+        http_reqs = k6_metrics['http_reqs'].get('values', {})
+        metrics['throughput_requests_per_second'] = http_reqs.get('rate', 0)
+        metrics['throughput_total_requests'] = http_reqs.get('count', 0)
+    elif is_grpc and 'iterations' in k6_metrics:
         # For gRPC, use iterations as throughput equivalent
-        iterations = data['metrics']['iterations']
-        metrics['throughput_requests_per_second'] = iterations.get('values', {}).get('rate', 0)
-        metrics['throughput_total_requests'] = iterations.get('values', {}).get('count', 0)
+        iterations = k6_metrics['iterations'].get('values', {})
+        metrics['throughput_requests_per_second'] = iterations.get('rate', 0)
+        metrics['throughput_total_requests'] = iterations.get('count', 0)
     
     # Extract success rate from checks
-    if 'checks' in data.get('metrics', {}):
-        checks = data['metrics']['checks']
-        metrics['success_rate_rate'] = checks.get('values', {}).get('rate', 0)
-        metrics['success_rate_passes'] = checks.get('values', {}).get('passes', 0)
-        metrics['success_rate_fails'] = checks.get('values', {}).get('fails', 0)
+    if 'checks' in k6_metrics:
+        checks = k6_metrics['checks'].get('values', {})
+        metrics['success_rate_rate'] = checks.get('rate', 0)
+        metrics['success_rate_passes'] = checks.get('passes', 0)
+        metrics['success_rate_fails'] = checks.get('fails', 0)
     
     return metrics
 
@@ -122,27 +111,16 @@ def calculate_average_metrics(all_metrics: List[Dict[str, Any]]) -> Dict[str, An
         print("No metrics to average")
         raise Exception("No metrics to average")
     
-    # Initialize counters and sums
-    counters = {}
-    sums = {}
-    
-    # Process each file's metrics
-    for metrics in all_metrics:
-        for metric_key, metric_value in metrics.items():
-            if metric_key not in counters:
-                counters[metric_key] = 0
-                sums[metric_key] = 0
-            
-            counters[metric_key] += 1
-            sums[metric_key] += metric_value
-    
-    # Calculate averages
-    average_metrics = {}
-    for metric_key in counters:
-        if counters[metric_key] > 0:
-            average_metrics[metric_key] = sums[metric_key] / counters[metric_key]
+    # One row per file, one column per metric key (in first-seen order)
+    metric_keys = list(dict.fromkeys(key for metrics in all_metrics for key in metrics))
+    present = np.array([[key in metrics for key in metric_keys] for metrics in all_metrics])
+    values = np.array([[metrics.get(key, 0) for key in metric_keys] for metrics in all_metrics],
+                      dtype=np.float64)
     
-    return average_metrics
+    # Each key is averaged over the files that reported it; rows are summed in file order
+    averages = values.sum(axis=0) / present.sum(axis=0)
+    
+    return dict(zip(metric_keys, averages.tolist()))
 
 def process_k6_metrics(folder_path: str, output_file: str):
     """
@@ -170,14 +148,16 @@ def process_k6_metrics(folder_path: str, output_file: str):
     
     print(f"Found {len(matching_files)} k6 result files to process:")
     
-    # Process each file
+    # Process each file; files may be parsed in parallel and are reported in file order
     all_metrics = []
-    for file_path in matching_files:
+    results = map_captured(extract_k6_metrics, matching_files)
+    
+    for file_path, (metrics, output) in zip(matching_files, results):
         file_name = os.path.basename(file_path)
         print(f"\nProcessing k6 file: {file_name}")
-        
-        # Extract metrics
-        metrics = extract_k6_metrics(file_path)
+        sys.stdout.write(output)
+        if isinstance(metrics, Exception):
+            raise metrics
         
         if not metrics:
             print(f"Failed to extract metrics from {file_name}")
@@ -195,14 +175,14 @@ def process_k6_metrics(folder_path: str, output_file: str):
 
     return average_metrics
 
-def run_k6_metrics_extraction(folder_path: str):
-    """Main function to process command line arguments and extract metrics"""
-    if len(sys.argv) < 2:
-        print("WRONG USAGE: python extract_k6_metrics.py <folder_path>")
-        sys.exit(1)
+def run(folder_path: str, output_file: Optional[str] = None):
+    """
+    Extract the k6 metrics of a folder and save their average to average_k6_metrics.json
     
-    folder_path = sys.argv[1]
-
+    Args:
+        folder_path: Path to the folder containing k6 result files
+        output_file: Where to save the average metrics instead (e.g. in run_all_extractions' output directory)
+    """
     if not os.path.isdir(folder_path):
         print(f"Error: '{folder_path}' is not a valid directory")
         sys.exit(1)
@@ -211,7 +191,7 @@ def run_k6_metrics_extraction(folder_path: str):
     average_metrics = process_k6_metrics(folder_path, "average_k6_metrics.json")
 
     if average_metrics:
-        average_output = os.path.join(folder_path, "average_k6_metrics.json")
+        average_output = output_file or os.path.join(folder_path, "average_k6_metrics.json")
         save_metrics_to_file(average_metrics, average_output)
         print(f"Average k6 metrics saved to: {average_output}")
         
@@ -222,5 +202,13 @@ def run_k6_metrics_extraction(folder_path: str):
     else:
         print("No k6 metrics extracted")
 
+def main():
+    """Main function to process command line arguments and extract metrics"""
+    if len(sys.argv) < 2:
+        print("WRONG USAGE: python extract_k6_metrics.py <folder_path>")
+        sys.exit(1)
+    
+    run(sys.argv[1])
+
 if __name__ == "__main__":
-    run_k6_metrics_extraction(sys.argv[1])
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+JSON Loading Helpers
+Shared file parsing and error handling for the metrics extractors
+"""
+
+import os
+import io
+import copy
+import json
+import mmap
+import functools
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterator, List, Tuple
+
+# orjson parses the metrics files much faster; json is the fallback if it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Below this size a plain read is cheaper than setting up a memory map
+MMAP_MIN_SIZE = 64 * 1024
+
+
+def load_json_file(json_file_path: str) -> Any:
+    """
+    Parse a JSON file, memory-mapping large files (e.g. CloudWatch exports) instead of copying them
+    
+    Args:
+        json_file_path: Path to the JSON file
+    
+    Returns:
+        Parsed JSON document
+    """
+    with open(json_file_path, 'rb') as file:
+        if orjson is None:
+            return json.loads(file.read())
+        
+        if os.fstat(file.fileno()).st_size < MMAP_MIN_SIZE:
+            return orjson.loads(file.read())
+        
+        # orjson parses straight from the mapped pages; the view must be released before the map closes
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            return orjson.loads(view)
+
+
+def with_json(default: Any) -> Callable:
+    """
+    Decorate an extractor so it receives the parsed JSON document of its input file
+    
+    The decorated function is called as extract(json_file_path) and the wrapped one as
+    extract(json_file_path, data). Missing files and invalid JSON are reported and
+    return a copy of the default instead.
+    
+    Args:
+        default: Value returned when the file cannot be read or parsed
+    
+    Returns:
+        Decorator for extract(json_file_path, data) functions
+    """
+    def decorator(extract: Callable[[str, Any], Any]) -> Callable[[str], Any]:
+        @functools.wraps(extract)
+        def wrapper(json_file_path: str) -> Any:
+            try:
+                data = load_json_file(json_file_path)
+            except FileNotFoundError:
+                print(f"Error: File '{json_file_path}' not found")
+                return copy.copy(default)
+            except json.JSONDecodeError:
+                # Also raised by orjson, whose JSONDecodeError subclasses it
+                print(f"Error: Invalid JSON in file '{json_file_path}'")
+                return copy.copy(default)
+            
+            return extract(json_file_path, data)
+        
+        return wrapper
+    
+    return decorator
+
+
+def extract_captured(extract: Callable[[str], Any], file_path: str) -> Tuple[Any, str]:
+    """
+    Run an extractor in a worker process, capturing what it prints
+    
+    Workers share the parent's stdout, so their messages are returned instead and
+    printed by the parent in file order.
+    
+    Args:
+        extract: Extraction function to call
+        file_path: File to extract metrics from
+        
+    Returns:
+        The extracted metrics (or the exception the extractor raised) and its printed output
+    """
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            metrics = extract(file_path)
+    except Exception as e:
+        # Keep what was printed before the failure; the parent re-raises it in order
+        return e, output.getvalue()
+    return metrics, output.getvalue()
+
+
+def map_captured(extract: Callable[[str], Any], file_paths: List[str]) -> Iterator[Tuple[Any, str]]:
+    """
+    Run an extractor over files with extract_captured, in worker processes when that pays off
+    
+    Files are parsed serially when there is at most one file or one CPU, or when the
+    extractor already runs inside a worker process (e.g. under run_all_extractions,
+    whose pool already spreads the work over the cores), so pools are never nested.
+    
+    Args:
+        extract: Extraction function to call
+        file_paths: Files to extract metrics from
+        
+    Returns:
+        Iterator over each file's (metrics or exception, printed output), in file order
+    """
+    workers = min(os.cpu_count() or 1, len(file_paths))
+    if workers <= 1 or multiprocessing.parent_process() is not None:
+        for file_path in file_paths:
+            yield extract_captured(extract, file_path)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(extract_captured, [extract] * len(file_paths), file_paths)
@@ -5,55 +5,45 @@ Creates service-specific folders and moves files accordingly
 """
 
 import os
+import sys
+import errno
 import shutil
-import glob
+from functools import lru_cache
 from pathlib import Path
 
+# Per-service files: run_{number}_{service}<suffix>
+SERVICE_FILE_SUFFIXES = (
+    '_cloudwatch_logs.json',
+    '_cpu_metrics.json',
+    '_memory_metrics.json',
+    '_network_rx_bytes_metrics.json',
+    '_network_tx_bytes_metrics.json'
+)
+
 def create_service_folders(base_path):
     """Create service folders in the given directory"""
     services = ['order', 'product', 'user', 'payment']
     
     for service in services:
         service_path = os.path.join(base_path, service)
-        if not os.path.exists(service_path):
+        # Create directly instead of checking first; an existing folder is left alone
+        try:
             os.makedirs(service_path)
-            print(f"Created folder: {service_path}")
+        except FileExistsError:
+            continue
+        print(f"Created folder: {service_path}")
 
+# Every test directory holds the same run_{number}_{service}_*.json names
+@lru_cache(maxsize=4096)
 def get_service_from_filename(filename):
     """Extract service name from filename"""
     # Handle different file patterns:
     # - run_{number}_{service}_*.json
     # - results_{protocol}:{test_type}_run_{number}.json (these stay in root)
     
-    if filename.startswith('run_') and '_cloudwatch_logs.json' in filename:
-        # run_{number}_{service}_cloudwatch_logs.json
-        parts = filename.split('_')
-        if len(parts) >= 3:
-            return parts[2]  # service is the third part
-    
-    elif filename.startswith('run_') and '_cpu_metrics.json' in filename:
-        # run_{number}_{service}_cpu_metrics.json
-        parts = filename.split('_')
-        if len(parts) >= 3:
-            return parts[2]
-    
-    elif filename.startswith('run_') and '_memory_metrics.json' in filename:
-        # run_{number}_{service}_memory_metrics.json
-        parts = filename.split('_')
-        if len(parts) >= 3:
-            return parts[2]
-    
-    elif filename.startswith('run_') and '_network_rx_bytes_metrics.json' in filename:
-        # run_{number}_{service}_network_rx_bytes_metrics.json
-        parts = filename.split('_')
-        if len(parts) >= 3:
-            return parts[2]
-    
-    elif filename.startswith('run_') and '_network_tx_bytes_metrics.json' in filename:
-        # run_{number}_{service}_network_tx_bytes_metrics.json
-        parts = filename.split('_')
-        if len(parts) >= 3:
-            return parts[2]
+    if filename.startswith('run_') and filename.endswith(SERVICE_FILE_SUFFIXES):
+        # run_{number}_{service}_<metric>.json: service is the third part
+        return filename.split('_', 3)[2]
     
     # Files that should stay in root (k6 results, timing, averages)
     return None
@@ -65,32 +55,44 @@ def organize_files_by_service(test_dir):
     # Create service folders
     create_service_folders(test_dir)
     
-    # Get all JSON files
-    json_files = glob.glob(os.path.join(test_dir, "*.json"))
-    
+    # Per-file status lines are collected and written once per directory
+    report = []
     moved_count = 0
-    for file_path in json_files:
-        filename = os.path.basename(file_path)
-        
-        # Determine service
-        service = get_service_from_filename(filename)
-        
-        if service:
-            # Move file to appropriate service folder
-            service_folder = os.path.join(test_dir, service)
-            destination = os.path.join(service_folder, filename)
-            
-            try:
-                shutil.move(file_path, destination)
-                print(f"  Moved {filename} -> {service}/")
-                moved_count += 1
-            except Exception as e:
-                print(f"  Error moving {filename}: {e}")
-        else:
-            # File stays in root (k6 results, timing, averages)
-            print(f"  Kept {filename} in root")
     
-    print(f"  Total files moved: {moved_count}")
+    # Act on each JSON file as the directory is read (hidden files skipped, as glob did);
+    # moved files go to subfolders, so the scan never sees an entry twice
+    with os.scandir(test_dir) as entries:
+        for entry in entries:
+            filename = entry.name
+            if not filename.endswith('.json') or filename.startswith('.') or not entry.is_file():
+                continue
+            
+            # Determine service
+            service = get_service_from_filename(filename)
+            
+            if service:
+                # Move file to appropriate service folder
+                service_folder = os.path.join(test_dir, service)
+                destination = os.path.join(service_folder, filename)
+                
+                try:
+                    try:
+                        # Same filesystem: a single rename
+                        os.rename(entry.path, destination)
+                    except OSError as e:
+                        if e.errno != errno.EXDEV:
+                            raise
+                        shutil.move(entry.path, destination)
+                    report.append(f"  Moved {filename} -> {service}/\n")
+                    moved_count += 1
+                except Exception as e:
+                    report.append(f"  Error moving {filename}: {e}\n")
+            else:
+                # File stays in root (k6 results, timing, averages)
+                report.append(f"  Kept {filename} in root\n")
+    
+    report.append(f"  Total files moved: {moved_count}\n")
+    sys.stdout.write(''.join(report))
 
 def main():
     """Main function to organize all test result directories"""
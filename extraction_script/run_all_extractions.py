@@ -6,10 +6,44 @@ Runs all three extraction scripts on each test directory and saves results to ou
 
 import os
 import sys
+import io
 import shutil
+import functools
+import contextlib
 import subprocess
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+
+# orjson serializes the summary report in C; like the extractors (see json_loading), the
+# scripts fall back to json if it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from json_loading import extract_captured
+
+# Extractors run in-process when importable, sparing an interpreter start per call;
+# otherwise the scripts are run as subprocesses. A missing dependency of the extractors
+# (e.g. numpy) would break the scripts too, so it is raised here instead
+try:
+    import extract_k6_metrics
+    import extract_cloudwatch_logs
+    import extract_cloudwatch_metrics
+except ModuleNotFoundError as e:
+    if e.name not in ('extract_k6_metrics', 'extract_cloudwatch_logs', 'extract_cloudwatch_metrics'):
+        raise
+    extract_k6_metrics = extract_cloudwatch_logs = extract_cloudwatch_metrics = None
+
+# Files picked up by extract_cloudwatch_metrics in a service directory
+CLOUDWATCH_METRICS_SUFFIXES = (
+    '_cpu_metrics.json',
+    '_memory_metrics.json',
+    '_network_rx_bytes_metrics.json',
+    '_network_tx_bytes_metrics.json'
+)
 
 
 def get_test_directories(base_path: str) -> List[str]:
@@ -22,6 +56,77 @@ def get_test_directories(base_path: str) -> List[str]:
     return sorted(test_dirs)
 
 
+def _run_extractor(extractor: Optional[Any], script: str, input_path: str, **outputs: str) -> Tuple[bool, str]:
+    """
+    Run one extractor on a folder, discarding its progress messages
+    
+    Args:
+        extractor: Imported extractor module exposing run(folder_path, ...), or None
+        script: Extraction script, run as a subprocess when extractor is None
+        input_path: Folder to extract metrics from
+        outputs: Output paths passed to run(); the script writes next to its input instead
+        
+    Returns:
+        Whether the extraction succeeded, and its error output
+    """
+    if extractor is None:
+        cmd = [sys.executable, script, input_path]
+        # Only stderr is reported; progress output is discarded rather than buffered and decoded
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, cwd=os.getcwd())
+        return result.returncode == 0, result.stderr
+    
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            extractor.run(input_path, **outputs)
+    except SystemExit as e:
+        # The scripts exit with a status on bad input; their messages went to stdout
+        return e.code in (None, 0), ""
+    except Exception:
+        return False, traceback.format_exc()
+    return True, ""
+
+
+def _has_cloudwatch_metrics(service_input: str) -> Optional[bool]:
+    """
+    Check whether a service directory holds any CloudWatch metrics files
+    
+    Args:
+        service_input: Service directory of a test directory
+        
+    Returns:
+        Whether metrics files were found, or None if the directory does not exist
+    """
+    try:
+        with os.scandir(service_input) as entries:
+            return any(entry.name.endswith(CLOUDWATCH_METRICS_SUFFIXES) for entry in entries)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _collect_output(extractor: Optional[Any], source: str, destination: str) -> bool:
+    """
+    Make sure an extractor's output file is in the output directory
+    
+    Imported extractors write there directly; scripts run as subprocesses write next to
+    their input, so the file is copied over.
+    
+    Args:
+        extractor: Imported extractor module, or None if the script ran as a subprocess
+        source: Output file written by the script
+        destination: Path in the output directory
+        
+    Returns:
+        Whether the output file is in place
+    """
+    if extractor is not None:
+        return os.path.exists(destination)
+    
+    if not os.path.exists(source):
+        return False
+    shutil.copy2(source, destination)
+    return True
+
+
 def create_output_structure(base_path: str, output_base: str):
     """Create output directory structure"""
     test_dirs = get_test_directories(base_path)
@@ -48,29 +153,23 @@ def run_k6_extraction(test_dir: str, base_path: str, output_base: str):
     output_path = os.path.join(output_base, test_dir)
     
     try:
-        # Run the k6 extraction script
-        cmd = [
-            sys.executable, 
-            "extraction_script/extract_k6_metrics.py", 
-            input_path
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=os.getcwd())
+        # Run the k6 extraction
+        dest_path = os.path.join(output_path, "k6_metrics.json")
+        succeeded, errors = _run_extractor(extract_k6_metrics, "extraction_script/extract_k6_metrics.py", input_path,
+                                           output_file=dest_path)
         
-        if result.returncode == 0:
+        if succeeded:
             print(f"  ✅ k6 extraction completed successfully")
             
-            # Copy the output file to our output directory
+            # Make sure the output file is in our output directory
             k6_output = os.path.join(input_path, "average_k6_metrics.json")
-            if os.path.exists(k6_output):
-                dest_path = os.path.join(output_path, "k6_metrics.json")
-                shutil.copy2(k6_output, dest_path)
+            if _collect_output(extract_k6_metrics, k6_output, dest_path):
                 print(f"  📁 k6 metrics saved to: {dest_path}")
             else:
                 print(f"  ⚠️  k6 output file not found")
         else:
             print(f"  ❌ k6 extraction failed:")
-            print(f"     {result.stderr}")
+            print(f"     {errors}")
             
     except Exception as e:
         print(f"  ❌ Error running k6 extraction: {e}")
@@ -84,26 +183,20 @@ def run_cloudwatch_logs_extraction(test_dir: str, base_path: str, output_base: s
     output_path = os.path.join(output_base, test_dir)
     
     try:
-        # Run the CloudWatch logs extraction script
-        cmd = [
-            sys.executable, 
-            "extraction_script/extract_cloudwatch_logs.py", 
-            input_path
-        ]
+        # Run the CloudWatch logs extraction
+        dest_path = os.path.join(output_path, "cloudwatch_logs_metrics.json")
+        succeeded, errors = _run_extractor(extract_cloudwatch_logs, "extraction_script/extract_cloudwatch_logs.py",
+                                           input_path, output_file=dest_path, output_dir=output_path)
         
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=os.getcwd())
-        
-        if result.returncode == 0:
+        if succeeded:
             print(f"  ✅ CloudWatch logs extraction completed successfully")
             
-            # Copy the combined output file to our output directory
+            # Make sure the combined output file is in our output directory
             logs_output = os.path.join(input_path, "average_cloudwatch_logs_metrics.json")
-            if os.path.exists(logs_output):
-                dest_path = os.path.join(output_path, "cloudwatch_logs_metrics.json")
-                shutil.copy2(logs_output, dest_path)
+            if _collect_output(extract_cloudwatch_logs, logs_output, dest_path):
                 print(f"  📁 Combined CloudWatch logs metrics saved to: {dest_path}")
             
-            # Copy per-service CloudWatch logs metrics files
+            # Per-service CloudWatch logs metrics files
             services = ['order', 'product', 'user', 'payment']
             for service in services:
                 service_input = os.path.join(input_path, service)
@@ -111,13 +204,12 @@ def run_cloudwatch_logs_extraction(test_dir: str, base_path: str, output_base: s
                 
                 if os.path.exists(service_input):
                     service_logs_file = os.path.join(service_input, "cloudwatch_logs_metrics.json")
-                    if os.path.exists(service_logs_file):
-                        dest_path = os.path.join(service_output, "cloudwatch_logs_metrics.json")
-                        shutil.copy2(service_logs_file, dest_path)
+                    dest_path = os.path.join(service_output, "cloudwatch_logs_metrics.json")
+                    if _collect_output(extract_cloudwatch_logs, service_logs_file, dest_path):
                         print(f"    📁 {service} service logs metrics saved to: {dest_path}")
         else:
             print(f"  ❌ CloudWatch logs extraction failed:")
-            print(f"     {result.stderr}")
+            print(f"     {errors}")
             
     except Exception as e:
         print(f"  ❌ Error running CloudWatch logs extraction: {e}")
@@ -132,40 +224,56 @@ def run_cloudwatch_metrics_extraction(test_dir: str, base_path: str, output_base
     
     services = ['order', 'product', 'user', 'payment']
     
+    def run_service(service: str) -> Tuple[bool, str]:
+        # Run the CloudWatch metrics extraction
+        return _run_extractor(extract_cloudwatch_metrics, "extraction_script/extract_cloudwatch_metrics.py",
+                              os.path.join(input_path, service),
+                              output_file=os.path.join(output_path, service, "cloudwatch_metrics.json"))
+    
+    # Directories without metrics files are reported without running the extractor
+    has_metrics = {service: _has_cloudwatch_metrics(os.path.join(input_path, service)) for service in services}
+    
+    # Services run concurrently as subprocesses, with results reported below in service order;
+    # in-process runs redirect the process-wide stdout, so they are called one by one below
+    futures = {}
+    if extract_cloudwatch_metrics is None:
+        with ThreadPoolExecutor(max_workers=len(services)) as executor:
+            futures = {service: executor.submit(run_service, service)
+                       for service in services if has_metrics[service]}
+    
     for service in services:
         service_input = os.path.join(input_path, service)
         service_output = os.path.join(output_path, service)
         
-        if not os.path.exists(service_input):
+        if has_metrics[service] is None:
             print(f"  ⚠️  Service directory not found: {service}")
             continue
             
         print(f"  🔧 Processing {service} service...")
         
+        if not has_metrics[service]:
+            print(f"    ⚠️  No CloudWatch metrics files found for {service}")
+            continue
+        
         try:
-            # Run the CloudWatch metrics extraction script
-            cmd = [
-                sys.executable, 
-                "extraction_script/extract_cloudwatch_metrics.py", 
-                service_input
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=os.getcwd())
+            if service in futures:
+                succeeded, errors = futures[service].result()
+            else:
+                succeeded, errors = run_service(service)
             
-            if result.returncode == 0:
+            if succeeded:
                 print(f"    ✅ {service} metrics extraction completed")
                 
-                # Copy the output file to our output directory
+                # Make sure the output file is in our output directory
                 metrics_output = os.path.join(service_input, "average_cloudwatch_metrics.json")
-                if os.path.exists(metrics_output):
-                    dest_path = os.path.join(service_output, "cloudwatch_metrics.json")
-                    shutil.copy2(metrics_output, dest_path)
+                dest_path = os.path.join(service_output, "cloudwatch_metrics.json")
+                if _collect_output(extract_cloudwatch_metrics, metrics_output, dest_path):
                     print(f"    📁 {service} metrics saved to: {dest_path}")
                 else:
                     print(f"    ⚠️  {service} output file not found")
             else:
                 print(f"    ❌ {service} metrics extraction failed:")
-                print(f"       {result.stderr}")
+                print(f"       {errors}")
                 
         except Exception as e:
             print(f"    ❌ Error running {service} metrics extraction: {e}")
@@ -202,9 +310,12 @@ def create_summary_report(output_base: str, test_dirs: List[str]):
     # Save summary report
     summary_path = os.path.join(output_base, "extraction_summary.json")
     try:
-        import json
-        with open(summary_path, 'w') as f:
-            json.dump(summary, f, indent=2)
+        if orjson is not None:
+            Path(summary_path).write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+        else:
+            # Same bytes as orjson: UTF-8 rather than escaped non-ASCII characters
+            import json
+            Path(summary_path).write_text(json.dumps(summary, indent=2, ensure_ascii=False), encoding='utf-8')
         print(f"  📁 Summary report saved to: {summary_path}")
     except Exception as e:
         print(f"  ❌ Error saving summary report: {e}")
@@ -239,20 +350,28 @@ def main():
     print(f"\n🏗️  Creating output directory structure...")
     create_output_structure(base_path, output_base)
     
-    # Process each test directory
-    for test_dir in test_dirs:
-        print(f"\n{'='*60}")
-        print(f"🔄 Processing: {test_dir}")
-        print(f"{'='*60}")
-        
-        # Run k6 extraction
-        run_k6_extraction(test_dir, base_path, output_base)
-        
-        # Run CloudWatch logs extraction
-        run_cloudwatch_logs_extraction(test_dir, base_path, output_base)
+    # k6, CloudWatch logs and per-service CloudWatch metrics extraction, each called with a test directory
+    steps = [functools.partial(step, base_path=base_path, output_base=output_base)
+             for step in (run_k6_extraction, run_cloudwatch_logs_extraction, run_cloudwatch_metrics_extraction)]
+    
+    # Every (test directory, step) pair is independent, so they run in parallel with one
+    # worker per CPU; extractors inside a worker parse their files serially, so pools never
+    # nest. Output is printed below in the original order
+    with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(test_dirs) * len(steps))) as executor:
+        outputs = [[executor.submit(extract_captured, step, test_dir) for step in steps]
+                   for test_dir in test_dirs]
         
-        # Run CloudWatch metrics extraction for each service
-        run_cloudwatch_metrics_extraction(test_dir, base_path, output_base)
+        # Process each test directory
+        for test_dir, step_outputs in zip(test_dirs, outputs):
+            print(f"\n{'='*60}")
+            print(f"🔄 Processing: {test_dir}")
+            print(f"{'='*60}")
+            
+            for step_output in step_outputs:
+                result, output = step_output.result()
+                sys.stdout.write(output)
+                if isinstance(result, Exception):
+                    raise result
     
     # Create summary report
     create_summary_report(output_base, test_dirs)
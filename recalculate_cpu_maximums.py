@@ -7,8 +7,23 @@ Script para recalcular os valores de métricas do CloudWatch:
 
 import json
 import os
+import sys
+import pickle
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set, Tuple
+
+# Utilitários compartilhados com os scripts de extração
+sys.path.insert(0, str(Path(__file__).resolve().parent / "extraction_script"))
+from json_loading import extract_captured
+
+# orjson analisa os arquivos de métricas bem mais rápido; json é o fallback se não estiver instalado
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 # Tipos de teste
 TEST_TYPES = [
@@ -25,9 +40,64 @@ TEST_TYPES = [
 # Serviços
 SERVICES = ["order", "payment", "product", "user"]
 
+# Diretórios de entrada (métricas brutas) e saída (resultados finais)
+TEST_RESULTS_ROOT = "test-results"
+FINAL_RESULTS_ROOT = "final_results"
+
 # Métricas a recalcular
 METRICS = ["cpu", "memory", "network_rx", "network_tx"]
 
+# Sufixo dos arquivos de cada métrica: run_{número}_{serviço}_<sufixo>
+METRIC_FILE_SUFFIXES = {
+    "cpu": "cpu_metrics.json",
+    "memory": "memory_metrics.json",
+    "network_rx": "network_rx_bytes_metrics.json",
+    "network_tx": "network_tx_bytes_metrics.json"
+}
+
+# Cache dos máximos já extraídos: caminho -> (mtime_ns, tamanho, máximo); arquivos inalterados
+# não são lidos de novo nas execuções seguintes
+MAX_CACHE_FILE = f"{TEST_RESULTS_ROOT}/.max_cache.pkl"
+
+# Cache carregado neste processo (na primeira consulta) e entradas novas ainda não salvas
+_max_cache: Optional[Dict[str, Tuple[int, int, float]]] = None
+_new_max_entries: Dict[str, Tuple[int, int, float]] = {}
+
+
+def _load_max_cache() -> Dict[str, Tuple[int, int, float]]:
+    """
+    Lê o cache de máximos salvo por execuções anteriores
+    
+    Returns:
+        Cache de máximos, ou um cache vazio se o arquivo não existir ou estiver corrompido
+    """
+    try:
+        with open(MAX_CACHE_FILE, 'rb') as f:
+            cache = pickle.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except Exception:
+        return {}
+
+
+def _save_max_cache(new_entries: Dict[str, Tuple[int, int, float]]):
+    """
+    Acrescenta novas entradas ao cache de máximos em disco
+    
+    Args:
+        new_entries: Entradas calculadas nesta execução
+    """
+    cache = _load_max_cache()
+    cache.update(new_entries)
+    
+    # Grava em um arquivo temporário e substitui, para nunca deixar um cache pela metade
+    temp_file = f"{MAX_CACHE_FILE}.tmp"
+    try:
+        with open(temp_file, 'wb') as f:
+            pickle.dump(cache, f)
+        os.replace(temp_file, MAX_CACHE_FILE)
+    except OSError as e:
+        print(f"Aviso: não foi possível salvar o cache {MAX_CACHE_FILE}: {e}")
+
 
 def get_maximum_value_from_file(file_path: str) -> float:
     """
@@ -39,30 +109,55 @@ def get_maximum_value_from_file(file_path: str) -> float:
     Returns:
         Valor máximo encontrado no arquivo, ou 0.0 se não encontrar
     """
+    global _max_cache
+    
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        # Arquivo inalterado (mesmo mtime e tamanho): reaproveita o máximo já calculado
+        stat = os.stat(file_path)
+        if _max_cache is None:
+            _max_cache = _load_max_cache()
+        cached = _max_cache.get(file_path)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
         
-        if 'Datapoints' not in data:
-            return 0.0
+        data = _loads(Path(file_path).read_bytes())
         
         max_values = []
-        for datapoint in data['Datapoints']:
-            if 'Maximum' in datapoint:
-                max_values.append(datapoint['Maximum'])
-        
-        if not max_values:
-            return 0.0
+        if 'Datapoints' in data:
+            for datapoint in data['Datapoints']:
+                if 'Maximum' in datapoint:
+                    max_values.append(datapoint['Maximum'])
         
         # Retorna o máximo entre todos os datapoints
-        return max(max_values)
+        max_value = max(max_values) if max_values else 0.0
     
     except Exception as e:
         print(f"Erro ao processar {file_path}: {e}")
         return 0.0
+    
+    _max_cache[file_path] = _new_max_entries[file_path] = (stat.st_mtime_ns, stat.st_size, max_value)
+    return max_value
+
+
+def list_metric_files(test_results_dir: str) -> Optional[Set[str]]:
+    """
+    Lista os arquivos de métricas de um serviço com uma única leitura do diretório
+    
+    Args:
+        test_results_dir: Diretório de métricas do serviço (ex: "test-results/grpc:average_load/order")
+        
+    Returns:
+        Conjunto com os nomes dos arquivos, ou None se o diretório não existir
+    """
+    try:
+        with os.scandir(test_results_dir) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
 
 
-def calculate_metric_value(test_type: str, service: str, metric_type: str) -> Dict[str, Any]:
+def calculate_metric_value(test_type: str, service: str, metric_type: str, test_results_dir: str,
+                           file_names: Optional[Set[str]]) -> Dict[str, Any]:
     """
     Calcula o valor da métrica para um serviço específico.
     Para CPU e Memory: retorna o máximo absoluto entre todos os runs.
@@ -72,33 +167,24 @@ def calculate_metric_value(test_type: str, service: str, metric_type: str) -> Di
         test_type: Tipo de teste (ex: "grpc:average_load")
         service: Nome do serviço (ex: "order")
         metric_type: Tipo de métrica (ex: "cpu", "memory", "network_rx", "network_tx")
+        test_results_dir: Diretório de métricas do serviço, montado uma vez por update_final_results
+        file_names: Arquivos do diretório do serviço, de list_metric_files
         
     Returns:
         Dicionário com average_maximum, total_files_processed e unit
     """
-    test_results_dir = Path("test-results") / test_type / service
-    
-    if not test_results_dir.exists():
+    if file_names is None:
         print(f"Diretório não encontrado: {test_results_dir}")
         return None
     
     # Encontrar todos os arquivos de métricas do tipo especificado
     metric_files = []
-    for run_num in range(1, 6):  # Assumindo runs de 1 a 5
-        if metric_type == "cpu":
-            file_name = f"run_{run_num}_{service}_cpu_metrics.json"
-        elif metric_type == "memory":
-            file_name = f"run_{run_num}_{service}_memory_metrics.json"
-        elif metric_type == "network_rx":
-            file_name = f"run_{run_num}_{service}_network_rx_bytes_metrics.json"
-        elif metric_type == "network_tx":
-            file_name = f"run_{run_num}_{service}_network_tx_bytes_metrics.json"
-        else:
-            continue
-        
-        file_path = test_results_dir / file_name
-        if file_path.exists():
-            metric_files.append(file_path)
+    suffix = METRIC_FILE_SUFFIXES.get(metric_type)
+    if suffix:
+        for run_num in range(1, 6):  # Assumindo runs de 1 a 5
+            file_name = f"run_{run_num}_{service}_{suffix}"
+            if file_name in file_names:
+                metric_files.append(file_name)
     
     if not metric_files:
         print(f"Nenhum arquivo encontrado para {test_type}/{service}/{metric_type}")
@@ -106,11 +192,11 @@ def calculate_metric_value(test_type: str, service: str, metric_type: str) -> Di
     
     # Extrair o valor máximo de cada arquivo
     maximum_values = []
-    for file_path in metric_files:
-        max_value = get_maximum_value_from_file(str(file_path))
+    for file_name in metric_files:
+        max_value = get_maximum_value_from_file(f"{test_results_dir}/{file_name}")
         if max_value > 0:
             maximum_values.append(max_value)
-            print(f"  {file_path.name}: máximo = {max_value:.2f}")
+            print(f"  {file_name}: máximo = {max_value:.2f}")
     
     if not maximum_values:
         return None
@@ -145,43 +231,46 @@ def update_final_results(test_type: str, service: str):
         test_type: Tipo de teste
         service: Nome do serviço
     """
-    final_results_file = Path("final_results") / test_type / service / "cloudwatch_metrics.json"
+    final_results_file = f"{FINAL_RESULTS_ROOT}/{test_type}/{service}/cloudwatch_metrics.json"
     
-    if not final_results_file.exists():
+    if not os.path.exists(final_results_file):
         print(f"Arquivo não encontrado: {final_results_file}")
         return
     
     # Ler o arquivo existente
     try:
-        with open(final_results_file, 'r') as f:
-            data = json.load(f)
+        data = _loads(Path(final_results_file).read_bytes())
     except Exception as e:
         print(f"Erro ao ler {final_results_file}: {e}")
         return
     
     print(f"\n=== Processando {test_type}/{service} ===")
     
+    # Uma única leitura do diretório serve para as quatro métricas
+    test_results_dir = f"{TEST_RESULTS_ROOT}/{test_type}/{service}"
+    file_names = list_metric_files(test_results_dir)
+    
     # Recalcular cada métrica
     if "cpu_utilization" in data:
-        cpu_result = calculate_metric_value(test_type, service, "cpu")
+        cpu_result = calculate_metric_value(test_type, service, "cpu", test_results_dir, file_names)
         if cpu_result:
             data["cpu_utilization"] = cpu_result
             print(f"CPU: {cpu_result['average_maximum']:.2f}% (máximo absoluto de {cpu_result['total_files_processed']} arquivos)")
     
     if "memory_utilization" in data:
-        memory_result = calculate_metric_value(test_type, service, "memory")
+        memory_result = calculate_metric_value(test_type, service, "memory", test_results_dir, file_names)
         if memory_result:
             data["memory_utilization"] = memory_result
             print(f"Memory: {memory_result['average_maximum']:.2f}% (máximo absoluto de {memory_result['total_files_processed']} arquivos)")
     
     if "network_rx_bytes" in data:
-        network_rx_result = calculate_metric_value(test_type, service, "network_rx")
+        network_rx_result = calculate_metric_value(test_type, service, "network_rx", test_results_dir, file_names)
         if network_rx_result:
             data["network_rx_bytes"] = network_rx_result
             print(f"Network RX: {network_rx_result['average_maximum']:.2f} bytes (média de {network_rx_result['total_files_processed']} arquivos)")
     
     if "network_tx_bytes" in data:
-        network_tx_result = calculate_metric_value(test_type, service, "network_tx")
+        network_tx_result = calculate_metric_value(test_type, service, "network_tx", test_results_dir, file_names)
         if network_tx_result:
             data["network_tx_bytes"] = network_tx_result
             print(f"Network TX: {network_tx_result['average_maximum']:.2f} bytes (média de {network_tx_result['total_files_processed']} arquivos)")
@@ -195,6 +284,24 @@ def update_final_results(test_type: str, service: str):
         print(f"Erro ao salvar {final_results_file}: {e}\n")
 
 
+def _update_collecting_cache(test_type: str, service: str) -> Dict[str, Tuple[int, int, float]]:
+    """
+    Executa update_final_results em um processo separado
+    
+    Args:
+        test_type: Tipo de teste
+        service: Nome do serviço
+        
+    Returns:
+        Novas entradas do cache de máximos, salvas pelo processo principal
+    """
+    update_final_results(test_type, service)
+    
+    new_entries = dict(_new_max_entries)
+    _new_max_entries.clear()
+    return new_entries
+
+
 def main():
     """
     Processa todos os tipos de teste e serviços
@@ -207,18 +314,37 @@ def main():
     
     total_processed = 0
     total_updated = 0
+    new_max_entries = {}
     
-    for test_type in TEST_TYPES:
-        for service in SERVICES:
-            final_results_file = Path("final_results") / test_type / service / "cloudwatch_metrics.json"
-            
-            if final_results_file.exists():
+    # Cada par (tipo de teste, serviço) é independente: todos são processados em paralelo
+    # e a saída é impressa na ordem original
+    with ProcessPoolExecutor() as executor:
+        futures = {}
+        for test_type in TEST_TYPES:
+            for service in SERVICES:
+                final_results_file = f"{FINAL_RESULTS_ROOT}/{test_type}/{service}/cloudwatch_metrics.json"
+                
+                if os.path.exists(final_results_file):
+                    futures[final_results_file] = executor.submit(
+                        extract_captured, functools.partial(_update_collecting_cache, test_type), service)
+                else:
+                    futures[final_results_file] = None
+        
+        for final_results_file, future in futures.items():
+            if future is not None:
                 total_processed += 1
-                update_final_results(test_type, service)
+                new_entries, output = future.result()
+                sys.stdout.write(output)
+                if isinstance(new_entries, Exception):
+                    raise new_entries
+                new_max_entries.update(new_entries)
                 total_updated += 1
             else:
                 print(f"Arquivo não encontrado: {final_results_file}")
     
+    if new_max_entries:
+        _save_max_cache(new_max_entries)
+    
     print("=" * 60)
     print(f"PROCESSAMENTO CONCLUÍDO")
     print(f"Total de arquivos processados: {total_processed}")